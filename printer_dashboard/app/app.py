@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
+import time
+
+# Reference point for the startup timing report
+STARTUP_STARTED = time.time()
+
 import os
 import json
+import queue
 import logging
 import asyncio
 from datetime import datetime, timedelta
@@ -9,28 +15,48 @@ from flask import Flask, render_template, jsonify, request, Response
 import requests
 from requests.exceptions import RequestException, Timeout
 import threading
-import time
+import importlib.util
 import urllib.parse
 from werkzeug.utils import secure_filename
 import base64
+import bisect
+import hashlib
+import io
+import mmap
+import random
 import re
+import signal
+import sqlite3
+import struct
 import tempfile
 import yaml
 import asyncio
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 from werkzeug.utils import secure_filename
 from flask import Flask, render_template, jsonify, request, url_for, send_file, Response
-try:
-    from moonraker_api import MoonrakerClient, MoonrakerListener
-    MOONRAKER_API_AVAILABLE = True
-except ImportError:
-    MOONRAKER_API_AVAILABLE = False
-
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Optional websocket libraries are only imported by the first client that uses them
+MOONRAKER_API_AVAILABLE = importlib.util.find_spec('moonraker_api') is not None
+AIOHTTP_AVAILABLE = importlib.util.find_spec('aiohttp') is not None
+# Pillow is optional too: without it thumbnails are served at their original size
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+
+# Configure logging (LOG_LEVEL=DEBUG for troubleshooting)
+logging.basicConfig(level=getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO))
 logger = logging.getLogger(__name__)
 
+# Startup phases in seconds since STARTUP_STARTED, reported by /api/health
+startup_timings = {}
+
+
+def mark_startup(phase):
+    """Record when a startup phase finished"""
+    startup_timings[phase] = round(time.time() - STARTUP_STARTED, 3)
+    logger.info(f"Startup: {phase} after {startup_timings[phase]:.2f}s")
+
 app = Flask(__name__, static_folder='static', static_url_path='/static')
 
 # Configure Flask for file uploads
@@ -44,55 +70,255 @@ os.makedirs(GCODE_STORAGE_DIR, exist_ok=True)
 
 # ---------------- Thumbnail extraction for stored G-code files ----------------
 
-THUMB_RE_BEGIN = re.compile(r";\s*thumbnail begin (\d+)x(\d+) \d+", re.IGNORECASE)
-THUMB_RE_END = re.compile(r";\s*thumbnail end", re.IGNORECASE)
+# Slicers put thumbnails and settings in the head of a file and print
+# statistics in its tail; only these windows are scanned
+GCODE_HEAD_BYTES = 1024 * 1024
+GCODE_HEADER_BYTES = 32 * 1024
+GCODE_TAIL_BYTES = 64 * 1024
+
+THUMB_RE_BEGIN = re.compile(rb";\s*(thumbnail(?:_JPG|_QOI)?) begin (\d+)x(\d+) (\d+)")
+THUMB_RE_END = re.compile(rb"^;\s*(thumbnail(?:_JPG|_QOI)?) end", re.MULTILINE)
+GCODE_COMMENT_RE = re.compile(rb"^;[^\n]*", re.MULTILINE)
+THUMB_MIMETYPES = {'thumbnail': 'image/png', 'thumbnail_jpg': 'image/jpeg', 'thumbnail_qoi': 'image/qoi'}
+
+
+def _parse_duration(text):
+    """Seconds from a slicer duration such as '1d 2h 3m 4s'"""
+    units = {'d': 86400, 'h': 3600, 'm': 60, 's': 1}
+    return float(sum(int(value) * units[unit] for value, unit in re.findall(r"(\d+)\s*([dhms])", text)))
+
+
+# (metadata key, pattern, converter) for PrusaSlicer/OrcaSlicer/SuperSlicer and Cura comments
+GCODE_METADATA_PATTERNS = [
+    ('slicer', re.compile(rb"^;\s*generated by (\S+(?: \S+)?)", re.IGNORECASE | re.MULTILINE), None),
+    ('slicer', re.compile(rb"^;\s*Generated with (\S+(?: \S+)?)", re.MULTILINE), None),
+    ('estimated_time', re.compile(rb"^;\s*estimated printing time(?: \(normal mode\))?\s*=\s*(.+)$", re.MULTILINE), _parse_duration),
+    ('estimated_time', re.compile(rb"^;TIME:(\d+)", re.MULTILINE), float),
+    ('filament_used_mm', re.compile(rb"^;\s*filament used \[mm\]\s*=\s*([\d.]+)", re.MULTILINE), float),
+    ('filament_used_mm', re.compile(rb"^;Filament used:\s*([\d.]+)m", re.MULTILINE), lambda v: float(v) * 1000),
+    ('filament_used_g', re.compile(rb"^;\s*(?:total )?filament used \[g\]\s*=\s*([\d.]+)", re.MULTILINE), float),
+    ('filament_type', re.compile(rb"^;\s*filament_type\s*=\s*(.+)$", re.MULTILINE), None),
+    ('layer_height', re.compile(rb"^;\s*layer_height\s*=\s*([\d.]+)", re.MULTILINE), float),
+    ('layer_height', re.compile(rb"^;Layer height:\s*([\d.]+)", re.MULTILINE), float),
+    ('nozzle_diameter', re.compile(rb"^;\s*nozzle_diameter\s*=\s*([\d.]+)", re.MULTILINE), float),
+    ('printer_model', re.compile(rb"^;\s*printer_model\s*=\s*(.+)$", re.MULTILINE), None),
+]
+
+
+def scan_gcode(path: str):
+    """Read embedded thumbnails and slicer metadata from a G-code file.
+
+    Thumbnails are looked for in the first GCODE_HEAD_BYTES, and metadata
+    in the GCODE_HEADER_BYTES after them and the last GCODE_TAIL_BYTES,
+    through a read-only memory map, so the cost does not depend on the
+    file size. A thumbnail block that starts in the head is read to its
+    end marker even if it runs past the window.
+
+    Returns {'thumbnails': [{'format', 'width', 'height', 'data'}], 'metadata': {...}}.
+    """
+    result = {'thumbnails': [], 'metadata': {}}
+    with open(path, 'rb') as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if not size:
+            return result
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            head_end = min(size, GCODE_HEAD_BYTES)
+            pos = 0
+            first_begin = None
+            while True:
+                # A plain find skips the G-code body much faster than a regex search
+                marker = mm.find(b'thumbnail', pos, head_end)
+                if marker < 0:
+                    break
+                begin = THUMB_RE_BEGIN.match(mm, mm.rfind(b'\n', 0, marker) + 1, head_end)
+                if not begin:
+                    pos = marker + len(b'thumbnail')
+                    continue
+                if first_begin is None:
+                    first_begin = begin.start()
+                kind = begin.group(1).decode().lower()
+                # The declared length counts base64 characters; allow for the '; ' and newline per line
+                limit = min(size, begin.end() + int(begin.group(4)) * 2 + 4096)
+                end = THUMB_RE_END.search(mm, begin.end(), limit)
+                if not end:
+                    break
+                encoded = re.sub(rb"[;\s]", b"", mm[begin.end():end.start()])
+                try:
+                    result['thumbnails'].append({
+                        'format': kind,
+                        'width': int(begin.group(2)),
+                        'height': int(begin.group(3)),
+                        'data': base64.b64decode(encoded)
+                    })
+                except Exception as e:
+                    logger.debug(f"Failed to decode {kind} {begin.group(2)}x{begin.group(3)} in {path}: {e}")
+                pos = end.end()
+
+            # Header comments surround the thumbnails; only comment lines are matched
+            header_end = min(size, pos + GCODE_HEADER_BYTES)
+            comments = GCODE_COMMENT_RE.findall(mm, 0, pos) if first_begin is None else GCODE_COMMENT_RE.findall(mm, 0, first_begin)
+            comments += GCODE_COMMENT_RE.findall(mm, pos, header_end)
+            if size > header_end:
+                comments += GCODE_COMMENT_RE.findall(mm, max(header_end, size - GCODE_TAIL_BYTES), size)
+    text = b'\n'.join(comments)
+    metadata = result['metadata']
+    for key, pattern, convert in GCODE_METADATA_PATTERNS:
+        if key in metadata:
+            continue
+        match = pattern.search(text)
+        if not match:
+            continue
+        value = match.group(1).decode('utf-8', 'ignore').strip()
+        try:
+            metadata[key] = convert(value) if convert else value
+        except ValueError:
+            pass
+    return result
+
+
+def _best_thumbnail(thumbnails):
+    """Return (bytes, mimetype) of the largest thumbnail, or (None, None).
+
+    PNG and JPEG thumbnails are preferred; a QOI thumbnail is only returned
+    when the file has nothing else, since browsers cannot display it.
+    """
+    if not thumbnails:
+        return None, None
+    best = max(thumbnails, key=lambda t: (t['format'] != 'thumbnail_qoi', t['width'] * t['height']))
+    logger.debug(f"Selected {best['width']}x{best['height']} {best['format']} from {len(thumbnails)} thumbnails")
+    return best['data'], THUMB_MIMETYPES[best['format']]
+
+
+class GcodeThumbnailIndex:
+    """Thumbnails of the stored G-code library, extracted once per file version.
 
+    Thumbnails are written as sidecar files in `.thumbs/` next to the
+    library, and `.thumbs/index.json` maps each file name to the mtime and
+    size it was extracted from. Files uploaded before the index existed, or
+    changed since, are (re)extracted on first request.
+    """
+
+    def __init__(self, directory=GCODE_STORAGE_DIR):
+        self.directory = directory
+        self.thumbs_dir = os.path.join(directory, '.thumbs')
+        self.index_path = os.path.join(self.thumbs_dir, 'index.json')
+        self._lock = threading.Lock()
+        self._entries = {}
+        try:
+            os.makedirs(self.thumbs_dir, exist_ok=True)
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r') as f:
+                    self._entries = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading G-code thumbnail index: {e}")
+
+    def _save(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.index_path)
+
+    def build(self, name):
+        """Extract a file's thumbnail into its sidecar and record it in the index"""
+        path = os.path.join(self.directory, name)
+        stat = os.stat(path)
+        scan = scan_gcode(path)
+        entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'thumb': None, 'metadata': scan['metadata']}
+        thumbnail, mimetype = _best_thumbnail(scan['thumbnails'])
+        if thumbnail:
+            entry['thumb'] = f"{name}.{mimetype.split('/')[1]}"
+            entry['type'] = mimetype
+            sidecar = os.path.join(self.thumbs_dir, entry['thumb'])
+            with open(sidecar + '.tmp', 'wb') as f:
+                f.write(thumbnail)
+            os.replace(sidecar + '.tmp', sidecar)
+        with self._lock:
+            previous = self._entries.get(name)
+            self._entries[name] = entry
+            self._save()
+        if previous and previous.get('thumb') and previous['thumb'] != entry['thumb']:
+            try:
+                os.remove(os.path.join(self.thumbs_dir, previous['thumb']))
+            except OSError:
+                pass
+        return entry
+
+    def _entry(self, name):
+        """Current index entry for a stored file, extracting it if missing or outdated"""
+        path = os.path.join(self.directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        entry = self._entries.get(name)
+        if not entry or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size or 'metadata' not in entry:
+            # Not indexed yet, or the file changed: extract once, concurrent requests share it
+            entry = upstream_flights.do(('library', name), self.build, name)
+        return entry
+
+    def metadata(self, name):
+        """Slicer metadata (estimated time, filament, layer height, ...) for a stored file"""
+        entry = self._entry(name)
+        return entry.get('metadata', {}) if entry else {}
+
+    def get(self, name):
+        """Return (thumbnail bytes, mimetype) for a stored file, or (None, None)"""
+        entry = self._entry(name)
+        if not entry or not entry.get('thumb'):
+            return None, None
+        try:
+            with open(os.path.join(self.thumbs_dir, entry['thumb']), 'rb') as f:
+                return f.read(), entry.get('type', 'image/png')
+        except OSError:
+            # Sidecar went missing; extract again next time
+            with self._lock:
+                self._entries.pop(name, None)
+            return None, None
+
+    def remove(self, name):
+        """Drop a deleted file's sidecar and index entry"""
+        with self._lock:
+            entry = self._entries.pop(name, None)
+            if entry is None:
+                return
+            self._save()
+        if entry.get('thumb'):
+            try:
+                os.remove(os.path.join(self.thumbs_dir, entry['thumb']))
+            except OSError:
+                pass
+
+
+gcode_thumbnails = GcodeThumbnailIndex()
+
+# Browsers reuse a thumbnail addressed by file name this long without
+# asking; after that they revalidate and get a 304 unless it changed
+THUMBNAIL_MAX_AGE = 60
 
-def _extract_embedded_thumbnail(path: str):
-    """Parse a G-code file and return PNG bytes of the largest embedded thumbnail found."""
+
+def thumbnail_response(data, mimetype, last_modified=None, max_age=THUMBNAIL_MAX_AGE):
+    """Image response with a strong content-hash ETag, answering conditional requests with 304.
+
+    `?w=&h=&format=` on the request selects a downscaled variant (see
+    thumbnail_variant). `max_age=None` makes browsers revalidate on every
+    use, for URLs whose image changes over time (such as a printer's
+    current job).
+    """
     try:
-        thumbnails = []
-        with open(path, "r", encoding="utf-8", errors="ignore") as fh:
-            collecting = False
-            current_size = (0, 0)
-            b64_lines = []
-            
-            for line in fh:
-                if not collecting:
-                    match = THUMB_RE_BEGIN.match(line)
-                    if match:
-                        width, height = int(match.group(1)), int(match.group(2))
-                        current_size = (width, height)
-                        collecting = True
-                        b64_lines = []
-                        continue
-                else:
-                    if THUMB_RE_END.match(line):
-                        if b64_lines:
-                            try:
-                                b64_data = "".join(b64_lines)
-                                thumbnail_bytes = base64.b64decode(b64_data)
-                                # Store thumbnail with its size for later comparison
-                                thumbnails.append((current_size[0] * current_size[1], thumbnail_bytes))
-                            except Exception as e:
-                                logger.debug(f"Failed to decode thumbnail {current_size}: {e}")
-                        collecting = False
-                        b64_lines = []
-                        continue
-                    # Remove leading '; ' or ';'
-                    cleaned = line.lstrip(';').strip()
-                    b64_lines.append(cleaned)
-            
-            # Return the largest thumbnail (by pixel count)
-            if thumbnails:
-                thumbnails.sort(key=lambda x: x[0], reverse=True)  # Sort by pixel count, largest first
-                largest_thumbnail = thumbnails[0][1]
-                logger.debug(f"Selected largest thumbnail from {len(thumbnails)} available thumbnails")
-                return largest_thumbnail
-                
-    except Exception as e:
-        logger.debug(f"No thumbnail extracted from {path}: {e}")
-    return None
+        spec = parse_variant_spec(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    data, mimetype = thumbnail_variant(data, mimetype, spec)
+    response = Response(data, mimetype=mimetype)
+    response.set_etag(hashlib.sha1(data).hexdigest())
+    if isinstance(last_modified, (int, float)) and last_modified > 0:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    if max_age is None:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.max_age = max_age
+    return response.make_conditional(request)
 
 
 @app.route('/api/gcode/thumbnail/<path:filename>')
@@ -103,15 +329,15 @@ def get_gcode_thumbnail(filename):
     if not os.path.isfile(file_path):
         return jsonify({'error': 'File not found'}), 404
 
-    img_bytes = _extract_embedded_thumbnail(file_path)
+    img_bytes, mimetype = gcode_thumbnails.get(safe_name)
     if img_bytes:
-        return Response(img_bytes, mimetype='image/png')
+        return thumbnail_response(img_bytes, mimetype, os.path.getmtime(file_path))
 
     # fallback placeholder (1x1 transparent png)
     placeholder = base64.b64decode(
         "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGMAAQAABQABDQottAAAAABJRU5ErkJggg=="
     )
-    return Response(placeholder, mimetype='image/png')
+    return thumbnail_response(placeholder, 'image/png', os.path.getmtime(file_path))
 
 @app.route('/files/thumbnail')
 def get_file_thumbnail():
@@ -125,15 +351,175 @@ def get_file_thumbnail():
     if not os.path.isfile(file_path):
         return jsonify({'error': 'File not found'}), 404
 
-    img_bytes = _extract_embedded_thumbnail(file_path)
+    img_bytes, mimetype = gcode_thumbnails.get(safe_name)
     if img_bytes:
-        return Response(img_bytes, mimetype='image/png')
+        return thumbnail_response(img_bytes, mimetype, os.path.getmtime(file_path))
 
     # fallback placeholder (1x1 transparent png)
     placeholder = base64.b64decode(
         "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGMAAQAABQABDQottAAAAABJRU5ErkJggg=="
     )
-    return Response(placeholder, mimetype='image/png')
+    return thumbnail_response(placeholder, 'image/png', os.path.getmtime(file_path))
+
+# ---------------- Pooled keep-alive HTTP sessions ----------------
+
+# Connections kept alive per upstream host; extra concurrent requests still
+# succeed, their connections just are not returned to the pool
+HTTP_POOL_MAXSIZE = 4
+
+
+def create_http_session(headers=None, pool_maxsize=HTTP_POOL_MAXSIZE, breaker=None):
+    """Create a requests session with a bounded keep-alive pool and default headers"""
+    session = CircuitBreakerSession(breaker) if breaker else requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of contacting a printer whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Tracks consecutive connection failures to one printer.
+
+    After `failure_threshold` consecutive connection failures the circuit
+    opens and every request fails immediately. While open, a cheap TCP
+    connect to the printer's port is tried at most every `probe_interval`
+    seconds; once the port answers the circuit goes half-open and lets
+    requests through again. The first success closes it, the first failure
+    (including a timeout) opens it again.
+    """
+    failure_threshold = 3
+    probe_interval = 15  # seconds between TCP probes while open
+    probe_timeout = 1
+
+    def __init__(self, name, url):
+        parsed = urlparse(url)
+        self.name = name
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        self.state = 'closed'
+        self.failures = 0
+        self._last_probe = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        """Whether a request may be sent now; probes the port when a probe is due"""
+        with self._lock:
+            if self.state != 'open':
+                return True
+            if time.time() - self._last_probe < self.probe_interval:
+                return False
+            # Claim the probe so concurrent callers keep failing fast meanwhile
+            self._last_probe = time.time()
+        if not test_moonraker_connection(self.host, self.port, self.probe_timeout):
+            return False
+        with self._lock:
+            if self.state == 'open':
+                self.state = 'half_open'
+                logger.info(f"{self.name} is answering again, circuit half-open")
+        return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            if self.state != 'closed':
+                logger.info(f"{self.name} circuit closed")
+            self.state = 'closed'
+
+    def record_failure(self):
+        with self._lock:
+            self._record_failure_locked()
+
+    def _record_failure_locked(self):
+        self.failures += 1
+        if self.state == 'half_open' or (self.state == 'closed' and self.failures >= self.failure_threshold):
+            self.state = 'open'
+            self._last_probe = time.time()
+            logger.warning(f"{self.name} unreachable after {self.failures} failures, circuit open")
+
+    def record_timeout(self):
+        """A slow response only counts while half-open, where it must not leave the circuit undecided"""
+        with self._lock:
+            if self.state == 'half_open':
+                self._record_failure_locked()
+
+
+class CircuitBreakerSession(requests.Session):
+    """Session that fails fast while its printer's circuit is open.
+
+    Only connection-level failures count against the circuit; an HTTP error
+    status or a slow response still means the printer is up, except while
+    the circuit is half-open.
+    """
+
+    def __init__(self, breaker):
+        super().__init__()
+        self.breaker = breaker
+
+    def request(self, method, url, *args, **kwargs):
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"{self.breaker.name} is unreachable (circuit open)")
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.exceptions.ConnectionError:
+            self.breaker.record_failure()
+            raise
+        except requests.exceptions.Timeout:
+            self.breaker.record_timeout()
+            raise
+        self.breaker.record_success()
+        return response
+
+
+class SingleFlight:
+    """Coalesces concurrent upstream fetches for the same key.
+
+    The first caller for a key runs the fetch; callers arriving while it is
+    in flight wait for it and share its result (or exception). With
+    `share_for` the result is also handed to callers arriving within that
+    many seconds after it completed.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, share_for=0, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.done() and time.time() > call.expires:
+                call = None
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+                call.expires = float('inf')
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.set_exception(e)
+            raise
+        with self._lock:
+            if share_for > 0:
+                call.expires = time.time() + share_for
+            else:
+                self._calls.pop(key, None)
+        call.set_result(result)
+        return result
+
+
+# Coalesces status, thumbnail and camera fetches keyed by (printer, resource)
+upstream_flights = SingleFlight()
+
 
 class PrinterAPI:
     """Base class for printer API interactions"""
@@ -145,6 +531,17 @@ class PrinterAPI:
         self.api_key = api_key
         self.last_update = None
         self.status_cache = {}
+        self.breaker = CircuitBreaker(name, self.url)
+        self.session = create_http_session(self._auth_headers(), breaker=self.breaker)
+
+    def _auth_headers(self):
+        """Authentication headers for this printer's API"""
+        headers = {}
+        if self.printer_type == 'octoprint' and self.api_key:
+            headers['X-Api-Key'] = self.api_key
+        elif self.printer_type == 'klipper' and self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        return headers
         
     def _make_request(self, endpoint, method='GET', data=None, timeout=5, allow_status=None):
         """Make HTTP request with proper headers
@@ -153,19 +550,13 @@ class PrinterAPI:
         if allow_status is None:
             allow_status = []
         try:
-            headers = {'Content-Type': 'application/json'}
-            
-            if self.printer_type == 'octoprint' and self.api_key:
-                headers['X-Api-Key'] = self.api_key
-            elif self.printer_type == 'klipper' and self.api_key:
-                headers['Authorization'] = f'Bearer {self.api_key}'
-                
             url = f"{self.url}/{endpoint.lstrip('/')}"
             
+            # Auth headers live on the pooled session; json= sets Content-Type
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=timeout)
+                response = self.session.get(url, timeout=timeout)
             elif method == 'POST':
-                response = requests.post(url, headers=headers, json=data, timeout=timeout)
+                response = self.session.post(url, json=data, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported method: {method}")
                 
@@ -174,6 +565,9 @@ class PrinterAPI:
             response.raise_for_status()
             return response.json()
             
+        except CircuitOpenError:
+            logger.debug(f"Skipping {endpoint} for {self.name}: circuit open")
+            return None
         except Exception as e:
             logger.error(f"Request failed for {self.name}: {e}")
             return None
@@ -188,9 +582,113 @@ class PrinterAPI:
             'error': 'Not implemented'
         }
 
+    def get_thumbnail_info(self, filename):
+        """Describe the largest thumbnail of a file - override in subclasses.
+
+        Returns {'url', 'modified', 'size'} (the last two identify the file
+        version), {} when the file has no thumbnail, or None when its
+        metadata could not be read.
+        """
+        return None
+
+    def download_thumbnail(self, info):
+        """Download the thumbnail described by get_thumbnail_info()"""
+        response = self.session.get(info['url'], timeout=10)
+        if response.status_code == 200:
+            return response.content
+        return None
+
+    def fetch_job_history(self, cursor):
+        """Return (jobs, new cursor) for jobs recorded after `cursor` - override in subclasses.
+
+        Jobs are dicts with job_id, filename, status, start_time, end_time,
+        print_duration, total_duration and filament_used (mm). Returns None
+        when the printer could not be queried.
+        """
+        return [], cursor
+
 class KlipperAPI(PrinterAPI):
     """Moonraker API for Klipper printers"""
-    
+
+    # Objects queried on every status poll, in addition to any chamber sensors
+    STATUS_OBJECTS = ['print_stats', 'toolhead', 'extruder', 'heater_bed', 'display_status', 'virtual_sdcard', 'webhooks']
+
+    def __init__(self, name, printer_type, url, api_key=None):
+        super().__init__(name, printer_type, url, api_key)
+        self.chamber_sensor_types = {}
+        self._discovery = None
+        self._discovery_lock = threading.Lock()
+        self._klippy_state = None
+        self.job_queue_interval = 30  # seconds between job queue refreshes
+        self._job_queue = []
+        self._job_queue_fetched = 0
+
+    @staticmethod
+    def _build_discovery(available_objects):
+        """Classify the objects reported by printer/objects/list"""
+        chamber_sensors = []
+        chamber_sensor_types = {}  # Store sensor type for each chamber sensor
+        macros = []
+        for obj in available_objects:
+            if not isinstance(obj, str):
+                continue
+            # Look for various chamber temperature sensor patterns
+            if ('temperature_sensor' in obj and 'chamber' in obj.lower()) or \
+               ('temperature_fan' in obj and 'chamber' in obj.lower()) or \
+               ('heater_generic' in obj and 'chamber' in obj.lower()):
+                chamber_sensors.append(obj)
+                # Store the sensor type for later use in temperature setting
+                if 'temperature_sensor' in obj:
+                    chamber_sensor_types[obj] = 'temperature_sensor'
+                elif 'temperature_fan' in obj:
+                    chamber_sensor_types[obj] = 'temperature_fan'
+                elif 'heater_generic' in obj:
+                    chamber_sensor_types[obj] = 'heater_generic'
+            elif obj.startswith('gcode_macro '):
+                macro_name = obj[len('gcode_macro '):].strip()
+                if macro_name:
+                    macros.append(macro_name)
+        return {
+            'objects': list(available_objects),
+            'chamber_sensors': chamber_sensors,
+            'chamber_sensor_types': chamber_sensor_types,
+            'macros': macros,
+            'macro_help': None
+        }
+
+    def _get_discovery(self):
+        """Return the cached object discovery, fetching printer/objects/list on first use.
+
+        The object list only changes when Klippy restarts, so the cache lives
+        until invalidate_discovery() is called (see _track_klippy_state).
+        Returns None if the printer could not be queried.
+        """
+        discovery = self._discovery
+        if discovery is not None:
+            return discovery
+        with self._discovery_lock:
+            if self._discovery is None:
+                objects_list = self._make_request('printer/objects/list')
+                if not objects_list or 'result' not in objects_list:
+                    return None
+                available_objects = objects_list.get('result', {}).get('objects', [])
+                self._discovery = self._build_discovery(available_objects)
+                self.chamber_sensor_types = self._discovery['chamber_sensor_types']
+                logger.debug(f"{self.name} discovered {len(available_objects)} Klipper objects")
+            return self._discovery
+
+    def invalidate_discovery(self):
+        """Drop cached object discovery so it is refetched on next use"""
+        self._discovery = None
+
+    def _track_klippy_state(self, klippy_state):
+        """Invalidate discovery whenever webhooks.state changes (e.g. a Klippy restart)"""
+        if klippy_state != self._klippy_state:
+            if self._klippy_state is not None:
+                logger.info(f"{self.name} Klippy state changed {self._klippy_state} -> {klippy_state}, refreshing object discovery")
+                self.invalidate_discovery()
+            self._klippy_state = klippy_state
+
     def _send_gcode(self, gcode_command, timeout=30):
         """Send G-code command to printer"""
         try:
@@ -243,29 +741,24 @@ class KlipperAPI(PrinterAPI):
         them out unless include_hidden is True.
         """
         try:
-            objects_list = self._make_request('printer/objects/list')
-            if not objects_list or 'result' not in objects_list:
+            discovery = self._get_discovery()
+            if not discovery:
                 return []
 
-            available_objects = objects_list.get('result', {}).get('objects', [])
-            macro_names = []
-            for obj in available_objects:
-                if isinstance(obj, str) and obj.startswith('gcode_macro '):
-                    name = obj[len('gcode_macro '):].strip()
-                    if not name:
-                        continue
-                    if not include_hidden and name.startswith('_'):
-                        continue
-                    macro_names.append(name)
+            macro_names = [name for name in discovery['macros']
+                           if include_hidden or not name.startswith('_')]
 
-            # Best-effort description lookup
-            descriptions = {}
-            help_resp = self._make_request('printer/gcode/help')
-            if help_resp and 'result' in help_resp:
-                help_map = help_resp.get('result', {}) or {}
-                # Keys in help are case-sensitive command names
-                for cmd, desc in help_map.items():
-                    descriptions[cmd.upper()] = desc
+            # Best-effort description lookup, cached alongside the discovery
+            descriptions = discovery['macro_help']
+            if descriptions is None:
+                descriptions = {}
+                help_resp = self._make_request('printer/gcode/help')
+                if help_resp and 'result' in help_resp:
+                    help_map = help_resp.get('result', {}) or {}
+                    # Keys in help are case-sensitive command names
+                    for cmd, desc in help_map.items():
+                        descriptions[cmd.upper()] = desc
+                    discovery['macro_help'] = descriptions
 
             macros = []
             for name in sorted(macro_names, key=str.upper):
@@ -286,42 +779,41 @@ class KlipperAPI(PrinterAPI):
         safe = macro_name.strip().split()[0]
         return self._send_gcode(safe, timeout=30)
 
+    def _get_job_queue(self):
+        """Return queued jobs, refreshed at most every `job_queue_interval` seconds"""
+        now = time.time()
+        if now - self._job_queue_fetched >= self.job_queue_interval:
+            job_queue = self._make_request('server/job_queue/status')
+            self._job_queue = job_queue.get('result', {}).get('queued_jobs', []) if job_queue else []
+            self._job_queue_fetched = now
+        return self._job_queue
+
+    def _query_status_objects(self, chamber_sensors):
+        """Fetch every status object in a single printer/objects/query round trip"""
+        query_params = '&'.join(self.STATUS_OBJECTS)
+        for sensor in chamber_sensors:
+            query_params += f'&{sensor.replace(" ", "%20")}'
+
+        printer_objects = self._make_request(f'printer/objects/query?{query_params}')
+        if not printer_objects:
+            return None
+        result = printer_objects.get('result', {})
+        return result.get('status', {}) if isinstance(result, dict) else {}
+
     def get_status(self):
-        """Get comprehensive printer status"""
+        """Get comprehensive printer status.
+
+        Steady state costs one printer/objects/query per call: object discovery
+        is cached and the job queue is refreshed on its own slower schedule.
+        """
         try:
-            # Get printer status
-            printer_info = self._make_request('printer/info')
-            
-            # First, get list of available objects to detect chamber sensors
-            objects_list = self._make_request('printer/objects/list')
-            chamber_sensors = []
-            chamber_sensor_types = {}  # Store sensor type for each chamber sensor
-            if objects_list and 'result' in objects_list:
-                available_objects = objects_list.get('result', {}).get('objects', [])
-                for obj in available_objects:
-                    # Look for various chamber temperature sensor patterns
-                    if ('temperature_sensor' in obj and 'chamber' in obj.lower()) or \
-                       ('temperature_fan' in obj and 'chamber' in obj.lower()) or \
-                       ('heater_generic' in obj and 'chamber' in obj.lower()):
-                        chamber_sensors.append(obj)
-                        # Store the sensor type for later use in temperature setting
-                        if 'temperature_sensor' in obj:
-                            chamber_sensor_types[obj] = 'temperature_sensor'
-                        elif 'temperature_fan' in obj:
-                            chamber_sensor_types[obj] = 'temperature_fan'
-                        elif 'heater_generic' in obj:
-                            chamber_sensor_types[obj] = 'heater_generic'
-            
-            # Build query string with chamber sensors
-            query_params = 'print_stats&toolhead&extruder&heater_bed&display_status&virtual_sdcard&webhooks'
-            for sensor in chamber_sensors:
-                query_params += f'&{sensor.replace(" ", "%20")}'
-            
-            printer_objects = self._make_request(f'printer/objects/query?{query_params}')
-            print_stats_direct = self._make_request('printer/print_stats')  # Direct print stats for accurate progress
-            job_queue = self._make_request('server/job_queue/status')
-            
-            if not printer_objects:
+            # Chamber sensors come from the cached object discovery
+            discovery = self._get_discovery()
+            chamber_sensors = discovery['chamber_sensors'] if discovery else []
+
+            status_data = self._query_status_objects(chamber_sensors)
+            if status_data is None:
+                self._track_klippy_state('offline')
                 return {
                     'name': self.name,
                     'type': 'klipper',
@@ -329,143 +821,9 @@ class KlipperAPI(PrinterAPI):
                     'state': 'offline',
                     'error': 'Cannot connect to printer'
                 }
-            
-            result = printer_objects.get('result', {})
-            status_data = result.get('status', {}) if isinstance(result, dict) else {}
-            print_stats = status_data.get('print_stats', {})
-            toolhead = status_data.get('toolhead', {})
-            extruder = status_data.get('extruder', {})
-            heater_bed = status_data.get('heater_bed', {})
-            display_status = status_data.get('display_status', {})
-            virtual_sdcard = status_data.get('virtual_sdcard', {})
-            webhooks = status_data.get('webhooks', {})
-            
-            # Get direct print stats for more accurate progress
-            direct_print_stats = {}
-            if print_stats_direct and 'result' in print_stats_direct:
-                direct_print_stats = print_stats_direct.get('result', {}).get('print_stats', {})
-            
-            def safe_round(value, digits=1):
-                try:
-                    return round(float(value), digits)
-                except (TypeError, ValueError):
-                    return 0
-            
-            # Calculate progress - use virtual_sdcard.progress for most accurate value
-            progress = 0
-            if virtual_sdcard.get('progress') not in [None, '']:
-                try:
-                    # virtual_sdcard.progress is decimal (0.0-1.0), convert to percentage
-                    progress = round(float(virtual_sdcard['progress']) * 100, 1)
-                except (TypeError, ValueError):
-                    progress = 0
-            elif direct_print_stats.get('progress') not in [None, '']:
-                try:
-                    # printer/print_stats progress is decimal (0.0-1.0), convert to percentage
-                    progress = round(float(direct_print_stats['progress']) * 100, 1)
-                except (TypeError, ValueError):
-                    progress = 0
-            elif display_status.get('progress') not in [None, '']:
-                try:
-                    # display_status.progress is typically in percentage (0-100)
-                    progress = round(float(display_status['progress']) * 100, 1)
-                except (TypeError, ValueError):
-                    progress = 0
-            
-            # Get print time - use direct print_stats if available
-            print_duration = 0
-            if direct_print_stats.get('info', {}).get('print_duration') not in [None, '']:
-                print_duration = direct_print_stats.get('info', {}).get('print_duration', 0) or 0
-            else:
-                print_duration = print_stats.get('print_duration', 0) or 0
-            
-            # Estimate remaining time
-            remaining_time = 0
-            if progress > 0 and progress < 100:
-                remaining_time = (print_duration / (progress / 100)) - print_duration
-            
-            # Get filename - prefer direct print_stats
-            filename = ''
-            if direct_print_stats.get('filename'):
-                filename = direct_print_stats.get('filename', '')
-            else:
-                filename = print_stats.get('filename', '')
-            
-            # Get state - prefer direct print_stats
-            state = 'ready'
-            if direct_print_stats.get('state'):
-                state = direct_print_stats.get('state', 'ready')
-            else:
-                state = print_stats.get('state', 'ready')
-
-            # Klippy host state takes precedence over print_stats: when the firmware is
-            # in shutdown/error/disconnect, print_stats may still report the last
-            # known print state ('standby', 'ready', etc.) which is misleading.
-            klippy_state = (webhooks.get('state') or '').lower()
-            klippy_message = webhooks.get('state_message', '') or ''
-            firmware_error = None
-            if klippy_state and klippy_state != 'ready':
-                if klippy_state in ('shutdown', 'error', 'disconnect', 'disconnected'):
-                    state = 'error'
-                    firmware_error = klippy_message or f'Klipper firmware {klippy_state}'
-                elif klippy_state == 'startup':
-                    state = 'startup'
-
-            # Store chamber sensor types for temperature setting
-            self.chamber_sensor_types = chamber_sensor_types
-            
-            # Process chamber temperature sensors
-            chamber_temps = []
-            for sensor in chamber_sensors:
-                sensor_data = status_data.get(sensor, {})
-                if sensor_data and 'temperature' in sensor_data:
-                    # Extract a friendly name from the sensor name
-                    friendly_name = sensor.replace('temperature_sensor ', '').replace('temperature_fan ', '').replace('heater_generic ', '').replace('_', ' ').title()
-                    chamber_temps.append({
-                        'name': friendly_name,
-                        'sensor_id': sensor,  # Store original sensor ID for temperature setting
-                        'sensor_type': chamber_sensor_types.get(sensor, 'unknown'),
-                        'actual': round(sensor_data.get('temperature', 0), 1),
-                        'target': round(sensor_data.get('target', 0), 1) if 'target' in sensor_data else None
-                    })
-            
-            result = {
-                'name': self.name,
-                'type': 'klipper',
-                'online': True,
-                'state': state,
-                'progress': progress,
-                'file': filename,
-                'print_time': self._format_time(print_duration),
-                'remaining_time': self._format_time(remaining_time),
-                'extruder_temp': {
-                    'actual': round(extruder.get('temperature', 0), 1),
-                    'target': round(extruder.get('target', 0), 1)
-                },
-                'bed_temp': {
-                    'actual': round(heater_bed.get('temperature', 0), 1),
-                    'target': round(heater_bed.get('target', 0), 1)
-                },
-                'position': {
-                    'x': round(toolhead.get('position', [0, 0, 0, 0])[0], 2),
-                    'y': round(toolhead.get('position', [0, 0, 0, 0])[1], 2),
-                    'z': round(toolhead.get('position', [0, 0, 0, 0])[2], 2)
-                },
-                'message': display_status.get('message', ''),
-                'klippy_state': webhooks.get('state', 'unknown'),
-                'queue_status': job_queue.get('result', {}).get('queued_jobs', []) if job_queue else []
-            }
-
-            # Add chamber temperatures if any were found
-            if chamber_temps:
-                result['chamber_temps'] = chamber_temps
 
-            # Surface a firmware-shutdown / disconnect message so the UI can display it
-            if firmware_error:
-                result['error'] = firmware_error
+            return self._build_status(status_data, discovery)
 
-            return result
-            
         except Exception as e:
             logger.error(f"Error getting Klipper status for {self.name}: {e}")
             return {
@@ -476,6 +834,109 @@ class KlipperAPI(PrinterAPI):
                 'error': str(e)
             }
 
+    def _build_status(self, status_data, discovery):
+        """Turn Klipper status objects into the dashboard's status dict"""
+        chamber_sensors = discovery['chamber_sensors'] if discovery else []
+        chamber_sensor_types = discovery['chamber_sensor_types'] if discovery else {}
+        print_stats = status_data.get('print_stats', {})
+        toolhead = status_data.get('toolhead', {})
+        extruder = status_data.get('extruder', {})
+        heater_bed = status_data.get('heater_bed', {})
+        display_status = status_data.get('display_status', {})
+        virtual_sdcard = status_data.get('virtual_sdcard', {})
+        webhooks = status_data.get('webhooks', {})
+        
+        # Calculate progress - use virtual_sdcard.progress for most accurate value
+        progress = 0
+        if virtual_sdcard.get('progress') not in [None, '']:
+            try:
+                # virtual_sdcard.progress is decimal (0.0-1.0), convert to percentage
+                progress = round(float(virtual_sdcard['progress']) * 100, 1)
+            except (TypeError, ValueError):
+                progress = 0
+        elif display_status.get('progress') not in [None, '']:
+            try:
+                # display_status.progress is typically in percentage (0-100)
+                progress = round(float(display_status['progress']) * 100, 1)
+            except (TypeError, ValueError):
+                progress = 0
+        
+        print_duration = print_stats.get('print_duration', 0) or 0
+        
+        # Estimate remaining time
+        remaining_time = 0
+        if progress > 0 and progress < 100:
+            remaining_time = (print_duration / (progress / 100)) - print_duration
+        
+        filename = print_stats.get('filename', '') or ''
+        state = print_stats.get('state', 'ready') or 'ready'
+
+        # Klippy host state takes precedence over print_stats: when the firmware is
+        # in shutdown/error/disconnect, print_stats may still report the last
+        # known print state ('standby', 'ready', etc.) which is misleading.
+        klippy_state = (webhooks.get('state') or '').lower()
+        self._track_klippy_state(klippy_state)
+        klippy_message = webhooks.get('state_message', '') or ''
+        firmware_error = None
+        if klippy_state and klippy_state != 'ready':
+            if klippy_state in ('shutdown', 'error', 'disconnect', 'disconnected'):
+                state = 'error'
+                firmware_error = klippy_message or f'Klipper firmware {klippy_state}'
+            elif klippy_state == 'startup':
+                state = 'startup'
+
+        # Process chamber temperature sensors
+        chamber_temps = []
+        for sensor in chamber_sensors:
+            sensor_data = status_data.get(sensor, {})
+            if sensor_data and 'temperature' in sensor_data:
+                # Extract a friendly name from the sensor name
+                friendly_name = sensor.replace('temperature_sensor ', '').replace('temperature_fan ', '').replace('heater_generic ', '').replace('_', ' ').title()
+                chamber_temps.append({
+                    'name': friendly_name,
+                    'sensor_id': sensor,  # Store original sensor ID for temperature setting
+                    'sensor_type': chamber_sensor_types.get(sensor, 'unknown'),
+                    'actual': round(sensor_data.get('temperature', 0), 1),
+                    'target': round(sensor_data.get('target', 0), 1) if 'target' in sensor_data else None
+                })
+        
+        result = {
+            'name': self.name,
+            'type': 'klipper',
+            'online': True,
+            'state': state,
+            'progress': progress,
+            'file': filename,
+            'print_time': self._format_time(print_duration),
+            'remaining_time': self._format_time(remaining_time),
+            'extruder_temp': {
+                'actual': round(extruder.get('temperature', 0), 1),
+                'target': round(extruder.get('target', 0), 1)
+            },
+            'bed_temp': {
+                'actual': round(heater_bed.get('temperature', 0), 1),
+                'target': round(heater_bed.get('target', 0), 1)
+            },
+            'position': {
+                'x': round(toolhead.get('position', [0, 0, 0, 0])[0], 2),
+                'y': round(toolhead.get('position', [0, 0, 0, 0])[1], 2),
+                'z': round(toolhead.get('position', [0, 0, 0, 0])[2], 2)
+            },
+            'message': display_status.get('message', ''),
+            'klippy_state': webhooks.get('state', 'unknown'),
+            'queue_status': self._get_job_queue()
+        }
+
+        # Add chamber temperatures if any were found
+        if chamber_temps:
+            result['chamber_temps'] = chamber_temps
+
+        # Surface a firmware-shutdown / disconnect message so the UI can display it
+        if firmware_error:
+            result['error'] = firmware_error
+
+        return result
+
     def _format_time(self, seconds):
         """Format seconds into HH:MM:SS"""
         if seconds <= 0:
@@ -507,21 +968,91 @@ class KlipperAPI(PrinterAPI):
             logger.error(f"Error canceling print: {e}")
             return {'success': False, 'error': str(e)}
 
-    def reprint(self):
-        """Reprint the last completed file using Moonraker's API"""
-        try:
-            # Get print history from Moonraker
-            history = self._make_request('server/history/list?limit=1')
+    def _thumbnail_info(self, filename, metadata):
+        """Build get_thumbnail_info() output from Moonraker file metadata"""
+        thumbnails = metadata.get('thumbnails') or []
+        # Get the largest thumbnail
+        largest_thumb = max(thumbnails, key=lambda t: t.get('width', 0) * t.get('height', 0), default={})
+        thumb_path = largest_thumb.get('relative_path')
+        if not thumb_path:
+            return {}
+        # relative_path is relative to the G-code file's directory
+        directory = os.path.dirname(filename)
+        if directory:
+            thumb_path = f"{directory}/{thumb_path}"
+        return {
+            'url': f"{self.url.rstrip('/')}/server/files/gcodes/{thumb_path}",
+            'modified': metadata.get('modified'),
+            'size': metadata.get('size')
+        }
+
+    def get_thumbnail_info(self, filename):
+        metadata_response = self._make_request(f"server/files/metadata?filename={urllib.parse.quote(filename, safe='')}")
+        if not metadata_response or 'result' not in metadata_response:
+            return None
+        return self._thumbnail_info(filename, metadata_response['result'])
+
+    # Jobs requested per page of server/history/list
+    history_page_size = 50
+
+    def fetch_job_history(self, cursor):
+        """Page through Moonraker's job history for jobs started after `cursor`.
+
+        The cursor is a job start time. It never moves past a job that is
+        still in progress, so that job is fetched again (and updated) until
+        it finishes.
+        """
+        jobs = []
+        offset = 0
+        while True:
+            endpoint = (f'server/history/list?order=asc&limit={self.history_page_size}'
+                        f'&start={offset}&since={cursor or 0}')
+            history = self._make_request(endpoint)
             if not history or 'result' not in history:
-                return {'success': False, 'error': 'Could not get print history'}
-            
-            # Get the most recent job
-            jobs = history.get('result', {}).get('jobs', [])
-            if not jobs:
-                return {'success': False, 'error': 'No print history found'}
-            
-            last_job = jobs[0]
-            filename = last_job.get('filename')
+                return None
+            page = history['result'].get('jobs', []) or []
+            for job in page:
+                jobs.append({
+                    'job_id': str(job.get('job_id')),
+                    'filename': job.get('filename') or '',
+                    'status': job.get('status') or 'unknown',
+                    'start_time': job.get('start_time') or 0,
+                    'end_time': job.get('end_time'),
+                    'print_duration': job.get('print_duration') or 0,
+                    'total_duration': job.get('total_duration') or 0,
+                    'filament_used': job.get('filament_used') or 0
+                })
+            if len(page) < self.history_page_size:
+                break
+            offset += len(page)
+
+        in_progress = [job['start_time'] for job in jobs if job['status'] == 'in_progress']
+        if in_progress:
+            cursor = max(cursor or 0, min(in_progress) - 1)
+        elif jobs:
+            cursor = max(job['start_time'] for job in jobs)
+        return jobs, cursor
+
+    def reprint(self, filename=None):
+        """Reprint the last completed file using Moonraker's API.
+
+        `filename` comes from the local job index when it is available;
+        otherwise Moonraker's history is queried for the most recent job.
+        """
+        try:
+            if not filename:
+                # Get print history from Moonraker
+                history = self._make_request('server/history/list?limit=1')
+                if not history or 'result' not in history:
+                    return {'success': False, 'error': 'Could not get print history'}
+                
+                # Get the most recent job
+                jobs = history.get('result', {}).get('jobs', [])
+                if not jobs:
+                    return {'success': False, 'error': 'No print history found'}
+                
+                last_job = jobs[0]
+                filename = last_job.get('filename')
             
             if not filename:
                 return {'success': False, 'error': 'No filename found in last print job'}
@@ -732,54 +1263,243 @@ class KlipperAPI(PrinterAPI):
             return None
 
 
+class AsyncLoopThread:
+    """A dedicated thread running the asyncio event loop shared by every websocket client.
+
+    Request threads never run or own an event loop; they hand coroutines to
+    submit(), which is thread-safe and returns a concurrent.futures.Future.
+    """
+
+    def __init__(self, name='websocket-loop'):
+        self.name = name
+        self.loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the loop thread if it is not already running and return the loop"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self.loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(self.loop)
+                    self.loop.call_soon(ready.set)
+                    self.loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+                self._thread.start()
+                ready.wait(5)
+                logger.info(f"Started shared asyncio loop thread '{self.name}'")
+            return self.loop
+
+    def submit(self, coro):
+        """Schedule a coroutine on the loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.start())
+
+
+# Single event loop shared by all Moonraker websocket clients
+websocket_loop = AsyncLoopThread()
+
+
 class KlipperWebSocketAPI(KlipperAPI):
-    """Enhanced Klipper API using WebSocket connection via moonraker-api"""
-    
+    """Enhanced Klipper API using WebSocket connection via moonraker-api
+
+    Subscribes to printer.objects.subscribe and applies notify_status_update
+    deltas to an in-memory copy of the Klipper status objects, so get_status()
+    is served without network I/O while the subscription is live. When the
+    websocket is down it falls back to HTTP polling.
+    """
+
+    reconnect_delay = 2  # initial seconds between websocket reconnect attempts
+    reconnect_max_delay = 60  # reconnect backoff cap
+
     def __init__(self, name, printer_type, url, api_key=None):
         super().__init__(name, printer_type, url, api_key)
         self.ws_client = None
         self.ws_listener = None
-        self._loop = None
         self._connected = False
+        self._disconnected = None
+        self._subscribed = False
+        self._live_status = {}
+        self._live_discovery = None
+        self._live_lock = threading.Lock()
+        self.live_updated = None
         
         # Parse URL to get host and port
         parsed = urlparse(url)
         self.host = parsed.hostname or 'localhost'
         self.port = parsed.port or 7125
+        self.ssl = parsed.scheme == 'https'
         
         if MOONRAKER_API_AVAILABLE:
             self._setup_websocket()
+            self.start_live_updates()
     
     def _setup_websocket(self):
         """Setup WebSocket client for real-time communication"""
+        from moonraker_api import MoonrakerClient, MoonrakerListener
+        from moonraker_api.const import WEBSOCKET_STATE_CONNECTED, WEBSOCKET_STATE_STOPPED
+
         class PrinterListener(MoonrakerListener):
             def __init__(self, printer_api):
                 self.printer_api = printer_api
                 
             async def state_changed(self, state: str) -> None:
                 logger.debug(f"{self.printer_api.name} WebSocket state: {state}")
-                self.printer_api._connected = state == "ready"
+                self.printer_api._connected = state == WEBSOCKET_STATE_CONNECTED
+                if state == WEBSOCKET_STATE_STOPPED:
+                    self.printer_api._on_websocket_closed()
                 
             async def on_exception(self, exception: Exception) -> None:
                 logger.error(f"{self.printer_api.name} WebSocket exception: {exception}")
                 
             async def on_notification(self, method: str, data) -> None:
-                logger.debug(f"{self.printer_api.name} WebSocket notification: {method}")
+                await self.printer_api._handle_notification(method, data)
         
         self.ws_listener = PrinterListener(self)
         self.ws_client = MoonrakerClient(
             self.ws_listener,
             self.host,
             self.port,
-            self.api_key
+            self.api_key,
+            ssl=self.ssl,
+            loop=websocket_loop.start()
         )
+
+    def start_live_updates(self):
+        """Start the connect/subscribe loop on the shared websocket event loop"""
+        return websocket_loop.submit(self._run_live_updates())
+
+    async def _run_live_updates(self):
+        """Keep the websocket connected and subscribed, reconnecting with exponential backoff"""
+        delay = self.reconnect_delay
+        while True:
+            self._disconnected = asyncio.Event()
+            try:
+                if await self.connect_websocket():
+                    logger.info(f"{self.name} WebSocket connected")
+                    delay = self.reconnect_delay
+                    await self._subscribe()
+                    await self._disconnected.wait()
+            except Exception as e:
+                logger.debug(f"{self.name} WebSocket connection attempt failed: {e}")
+            self._subscribed = False
+            logger.debug(f"{self.name} WebSocket reconnecting in {delay:.0f}s")
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+    def _on_websocket_closed(self):
+        """Called on the event loop when the websocket has stopped"""
+        self._subscribed = False
+        if self._disconnected is not None:
+            self._disconnected.set()
+
+    async def _subscribe(self):
+        """Discover objects and subscribe to status updates for them"""
+        objects = await self.ws_client.call_method('printer.objects.list')
+        if not isinstance(objects, dict) or 'error' in objects:
+            # Klippy is not ready yet; notify_klippy_ready will trigger a retry
+            logger.info(f"{self.name} Klippy not ready, waiting to subscribe: {objects}")
+            return False
+
+        discovery = self._build_discovery(objects.get('objects', []))
+        self._discovery = discovery
+        self.chamber_sensor_types = discovery['chamber_sensor_types']
+
+        subscription = {obj: None for obj in self.STATUS_OBJECTS + discovery['chamber_sensors']}
+        response = await self.ws_client.call_method('printer.objects.subscribe', objects=subscription)
+        if not isinstance(response, dict) or 'error' in response:
+            logger.warning(f"{self.name} status subscription failed: {response}")
+            return False
+
+        # Install the subscribe snapshot before awaiting anything else, so deltas
+        # that arrive meanwhile are applied on top of it rather than overwritten
+        with self._live_lock:
+            self._live_status = {obj: dict(data) for obj, data in response.get('status', {}).items()}
+            self._live_discovery = discovery
+        self.live_updated = time.time()
+
+        job_queue = await self.ws_client.call_method('server.job_queue.status')
+        if isinstance(job_queue, dict) and 'error' not in job_queue:
+            self._job_queue = job_queue.get('queued_jobs', [])
+        self._subscribed = True
+        logger.info(f"{self.name} subscribed to {len(subscription)} Klipper objects")
+        return True
+
+    @classmethod
+    def _merge_delta(cls, current, changes):
+        """Apply a status delta to a copy of `current`.
+
+        Klipper only sends the fields that changed, also inside nested
+        objects such as print_stats.info, so dict values are merged
+        recursively. Nested dicts are copied rather than updated in place,
+        which keeps copies handed out by get_status unaffected.
+        """
+        merged = dict(current)
+        for key, value in changes.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = cls._merge_delta(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
+
+    async def _handle_notification(self, method, data):
+        """Apply websocket notifications to the live status model"""
+        if method == 'notify_status_update':
+            if not data:
+                return
+            delta = data[0]
+            with self._live_lock:
+                for obj, changes in delta.items():
+                    self._live_status[obj] = self._merge_delta(self._live_status.get(obj, {}), changes)
+            self.live_updated = time.time()
+        elif method == 'notify_klippy_ready':
+            # Klippy restarted: the object list may have changed, so resubscribe
+            self.invalidate_discovery()
+            await self._subscribe()
+        elif method in ('notify_klippy_shutdown', 'notify_klippy_disconnected'):
+            klippy_state = 'shutdown' if method == 'notify_klippy_shutdown' else 'disconnected'
+            with self._live_lock:
+                self._live_status.setdefault('webhooks', {})['state'] = klippy_state
+            if klippy_state == 'disconnected':
+                # Subscriptions do not survive a Klippy disconnect; poll until ready again
+                self._subscribed = False
+        elif method == 'notify_job_queue_changed':
+            updated_queue = data[0].get('updated_queue') if data else None
+            if updated_queue is not None:
+                self._job_queue = updated_queue
+
+    @property
+    def is_live(self):
+        """True when status is being pushed over the websocket subscription"""
+        return self._subscribed and self._connected
+
+    def get_status(self):
+        """Get printer status from the live subscription, or over HTTP when it is down"""
+        if not self.is_live:
+            return super().get_status()
+        try:
+            with self._live_lock:
+                status_data = {obj: dict(data) for obj, data in self._live_status.items()}
+                discovery = self._live_discovery
+            return self._build_status(status_data, discovery)
+        except Exception as e:
+            logger.error(f"Error building live Klipper status for {self.name}: {e}")
+            return super().get_status()
+
+    def _get_job_queue(self):
+        """Job queue is pushed via notify_job_queue_changed while live"""
+        if self.is_live:
+            return self._job_queue
+        return super()._get_job_queue()
     
     async def connect_websocket(self):
         """Connect to WebSocket if available"""
         if self.ws_client and not self._connected:
             try:
-                await self.ws_client.connect()
-                return True
+                return await self.ws_client.connect()
             except Exception as e:
                 logger.error(f"{self.name} WebSocket connection failed: {e}")
                 return False
@@ -794,108 +1514,157 @@ class KlipperWebSocketAPI(KlipperAPI):
             except Exception as e:
                 logger.error(f"{self.name} WebSocket disconnect failed: {e}")
     
-    async def get_thumbnail_async(self, filename: str) -> Optional[bytes]:
-        """Get thumbnail data for a file using WebSocket API"""
+    async def get_thumbnail_info_async(self, filename: str) -> Optional[dict]:
+        """Look up a file's thumbnail over the WebSocket"""
         if not self.ws_client or not self._connected:
             return None
             
         try:
             # Query file metadata to get thumbnail path
-            response = await self.ws_client.request("server.files.metadata", {"filename": filename})
-            
-            if not response or "result" not in response:
-                return None
-                
-            metadata = response["result"]
-            thumbnails = metadata.get("thumbnails", [])
-            
-            if not thumbnails:
-                return None
-            
-            # Get the largest thumbnail available
-            largest_thumb = max(thumbnails, key=lambda t: t.get("width", 0) * t.get("height", 0))
-            thumb_path = largest_thumb.get("relative_path")
+            metadata = await self.ws_client.call_method("server.files.metadata", filename=filename)
             
-            if not thumb_path:
+            if not isinstance(metadata, dict) or 'error' in metadata:
                 return None
-            
-            # Download thumbnail data
-            thumb_response = await self.ws_client.request("server.files.get_file", {
-                "path": f"gcodes/{thumb_path}"
-            })
-            
-            if thumb_response and "result" in thumb_response:
-                return thumb_response["result"]
+            return self._thumbnail_info(filename, metadata)
                 
         except Exception as e:
             logger.error(f"{self.name} Failed to get thumbnail via WebSocket: {e}")
             
         return None
     
-    def get_thumbnail(self, filename: str) -> Optional[bytes]:
-        """Synchronous wrapper for thumbnail retrieval"""
-        if not MOONRAKER_API_AVAILABLE or not self.ws_client:
-            # Fallback to HTTP method
-            return self._get_thumbnail_http(filename)
-            
-        # Run async method in event loop
-        try:
-            if self._loop is None or self._loop.is_closed():
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-            
-            # Ensure connection
-            if not self._connected:
-                self._loop.run_until_complete(self.connect_websocket())
-            
-            if self._connected:
-                return self._loop.run_until_complete(self.get_thumbnail_async(filename))
-                
-        except Exception as e:
-            logger.error(f"{self.name} Async thumbnail retrieval failed: {e}")
+    def get_thumbnail_info(self, filename: str) -> Optional[dict]:
+        """Thumbnail lookup over the WebSocket, falling back to HTTP"""
+        if self.ws_client and self._connected:
+            # Run on the shared websocket event loop and wait for the result
+            try:
+                info = websocket_loop.submit(self.get_thumbnail_info_async(filename)).result(timeout=15)
+                if info is not None:
+                    return info
+            except Exception as e:
+                logger.error(f"{self.name} Async thumbnail retrieval failed: {e}")
             
         # Fallback to HTTP
-        return self._get_thumbnail_http(filename)
-    
-    def _get_thumbnail_http(self, filename: str) -> Optional[bytes]:
-        """Fallback HTTP method for thumbnail retrieval"""
-        try:
-            # Get file metadata first
-            metadata_response = self._make_request(f'server/files/metadata?filename={filename}')
-            if not metadata_response or 'result' not in metadata_response:
-                return None
-                
-            metadata = metadata_response['result']
-            thumbnails = metadata.get('thumbnails', [])
-            
-            if not thumbnails:
-                return None
-            
-            # Get the largest thumbnail
-            largest_thumb = max(thumbnails, key=lambda t: t.get('width', 0) * t.get('height', 0))
-            thumb_path = largest_thumb.get('relative_path')
-            
-            if not thumb_path:
-                return None
-            
-            # Download thumbnail
-            thumb_url = f"{self.url.rstrip('/')}/server/files/gcodes/{thumb_path}"
-            response = requests.get(thumb_url, timeout=10)
-            
-            if response.status_code == 200:
-                return response.content
-                
-        except Exception as e:
-            logger.error(f"{self.name} HTTP thumbnail retrieval failed: {e}")
-            
-        return None
+        return super().get_thumbnail_info(filename)
 
 
 class OctoPrintAPI(PrinterAPI):
-    """OctoPrint API for OctoPrint printers"""
-    
+    """OctoPrint API for OctoPrint printers
+
+    When aiohttp is available a push client keeps a per-printer state model
+    updated from the `current` messages OctoPrint sends over its raw SockJS
+    websocket; get_status() reads that model and only polls the REST API
+    while the push connection is down.
+    """
+
+    reconnect_delay = 2  # initial seconds between push socket reconnect attempts
+    reconnect_max_delay = 60  # reconnect backoff cap
+    push_throttle = 2  # OctoPrint sends `current` every 500ms * throttle
+    push_stale_after = 30  # seconds without a push message before falling back to polling
+
+    def __init__(self, name, printer_type, url, api_key=None):
+        super().__init__(name, printer_type, url, api_key)
+        self._push_lock = threading.Lock()
+        self._push_printer = None
+        self._push_job = None
+        self._push_connected = False
+        self._polled_position = {}  # x/y from the last poll; pushes only carry Z
+        self.live_updated = None
+
+        if AIOHTTP_AVAILABLE:
+            self.start_live_updates()
+
+    def start_live_updates(self):
+        """Start the push socket client on the shared websocket event loop"""
+        return websocket_loop.submit(self._run_live_updates())
+
+    def _login_passive(self):
+        """Exchange the API key for a user/session pair to authenticate the push socket"""
+        login = self._make_request('api/login', method='POST', data={'passive': True})
+        if login and login.get('name') and login.get('session'):
+            return f"{login['name']}:{login['session']}"
+        return None
+
+    async def _run_live_updates(self):
+        """Keep the push socket connected, reconnecting with exponential backoff"""
+        import aiohttp
+
+        ws_url = re.sub(r'^http', 'ws', self.url) + '/sockjs/websocket'
+        loop = asyncio.get_running_loop()
+        delay = self.reconnect_delay
+        while True:
+            try:
+                auth = await loop.run_in_executor(None, self._login_passive)
+                if auth:
+                    async with aiohttp.ClientSession() as session:
+                        async with session.ws_connect(ws_url, heartbeat=30) as ws:
+                            await ws.send_str(json.dumps({'auth': auth}))
+                            await ws.send_str(json.dumps({'throttle': self.push_throttle}))
+                            self._push_connected = True
+                            delay = self.reconnect_delay
+                            logger.info(f"{self.name} OctoPrint push socket connected")
+                            async for message in ws:
+                                if message.type == aiohttp.WSMsgType.TEXT:
+                                    if not self._handle_push_message(message.json()):
+                                        break
+                                elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                    break
+            except Exception as e:
+                logger.debug(f"{self.name} OctoPrint push socket failed: {e}")
+            self._push_connected = False
+            logger.debug(f"{self.name} OctoPrint push socket reconnecting in {delay:.0f}s")
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+    def _handle_push_message(self, message):
+        """Apply a push message to the state model; returns False if the socket must reconnect"""
+        if 'reauthRequired' in message:
+            return False
+        payload = message.get('current') or message.get('history')
+        if not isinstance(payload, dict):
+            return True
+
+        with self._push_lock:
+            printer_status = dict(self._push_printer or {})
+            job_status = dict(self._push_job or {})
+            if 'state' in payload:
+                printer_status['state'] = payload['state']
+            temps = payload.get('temps') or []
+            if temps:
+                # Samples are oldest first; keep only the newest reading
+                latest = temps[-1]
+                printer_status['temperature'] = {
+                    key: value for key, value in latest.items() if isinstance(value, dict)
+                }
+            if payload.get('currentZ') is not None:
+                position = dict(printer_status.get('position') or self._polled_position)
+                position['z'] = payload['currentZ']
+                printer_status['position'] = position
+            if 'job' in payload:
+                job_status['job'] = payload['job']
+            if 'progress' in payload:
+                job_status['progress'] = payload['progress']
+            self._push_printer = printer_status
+            self._push_job = job_status
+        self.live_updated = time.time()
+        return True
+
+    @property
+    def is_live(self):
+        """True when status is being pushed over the OctoPrint socket"""
+        return (self._push_connected and self._push_printer is not None
+                and self.live_updated is not None
+                and time.time() - self.live_updated < self.push_stale_after)
+
     def get_status(self):
         """Get comprehensive printer status"""
+        if self.is_live:
+            try:
+                with self._push_lock:
+                    printer_status, job_status = self._push_printer, self._push_job
+                return self._build_status(printer_status, job_status)
+            except Exception as e:
+                logger.error(f"Error building live OctoPrint status for {self.name}: {e}")
+
         try:
             # Get printer status
             printer_status = self._make_request('api/printer', allow_status=[409])
@@ -910,82 +1679,10 @@ class OctoPrintAPI(PrinterAPI):
                     'error': 'Cannot connect to printer'
                 }
             
-            # Normalize missing data
-            if printer_status is None:
-                printer_status = {}
-            if job_status is None:
-                job_status = {}
-            
-            # Define safe_round function first
-            def safe_round(value, digits=1):
-                try:
-                    return round(float(value), digits)
-                except (TypeError, ValueError):
-                    return 0
-            
-            # Parse temperature data safely
-            temps = printer_status.get('temperature', {}) if isinstance(printer_status, dict) else {}
-            tool0 = temps.get('tool0', {})
-            bed = temps.get('bed', {})
-            
-            # Look for chamber temperature sensors in OctoPrint
-            chamber_temps = []
-            for key, temp_data in temps.items():
-                if 'chamber' in key.lower() and isinstance(temp_data, dict) and 'actual' in temp_data:
-                    # Extract friendly name
-                    friendly_name = key.replace('_', ' ').title()
-                    chamber_temps.append({
-                        'name': friendly_name,
-                        'actual': safe_round(temp_data.get('actual', 0)),
-                        'target': safe_round(temp_data.get('target', 0)) if temp_data.get('target') is not None else None
-                    })
-            
-            # Parse job data
-            job = job_status.get('job', {}) if isinstance(job_status, dict) else {}
-            progress = job_status.get('progress', {}) if isinstance(job_status, dict) else {}
-            state = printer_status.get('state', {}) if isinstance(printer_status, dict) else {}
-            
-            # Parse position data from main printer endpoint
-            position_data = printer_status.get('position', {}) if isinstance(printer_status, dict) else {}
-            position = {
-                'x': safe_round(position_data.get('x', 0), 2),
-                'y': safe_round(position_data.get('y', 0), 2),
-                'z': safe_round(position_data.get('z', 0), 2)
-            }
-            
-            # Calculate remaining time
-            remaining = progress.get('printTimeLeft') or 0
-            remaining_formatted = self._format_time(remaining) if remaining else "Unknown"
-            
-            result = {
-                'name': self.name,
-                'type': 'octoprint',
-                'online': True,
-                'state': state.get('text', 'unknown').lower() if isinstance(state, dict) else 'unknown',
-                'progress': safe_round(progress.get('completion', 0)),
-                'file': job.get('file', {}).get('name', '') if isinstance(job, dict) else '',
-                'file_uploaded': job.get('file', {}).get('date', None) if isinstance(job, dict) else None,
-                'print_time': self._format_time(progress.get('printTime', 0) or 0),
-                'remaining_time': remaining_formatted,
-                'extruder_temp': {
-                    'actual': safe_round(tool0.get('actual', 0)),
-                    'target': safe_round(tool0.get('target', 0))
-                },
-                'bed_temp': {
-                    'actual': safe_round(bed.get('actual', 0)),
-                    'target': safe_round(bed.get('target', 0))
-                },
-                'position': position,
-                'message': state.get('text', '') if isinstance(state, dict) else '',
-                'ready': state.get('flags', {}).get('ready', False) if isinstance(state, dict) else False
-            }
-            
-            # Add chamber temperatures if any were found
-            if chamber_temps:
-                result['chamber_temps'] = chamber_temps
-                
-            return result
-            
+            if isinstance(printer_status.get('position'), dict):
+                self._polled_position = dict(printer_status['position'])
+            return self._build_status(printer_status, job_status)
+
         except Exception as e:
             logger.error(f"Error getting OctoPrint status for {self.name}: {e}")
             return {
@@ -995,7 +1692,85 @@ class OctoPrintAPI(PrinterAPI):
                 'state': 'error',
                 'error': str(e)
             }
-    
+
+    def _build_status(self, printer_status, job_status):
+        """Turn OctoPrint printer and job data into the dashboard's status dict"""
+        # Normalize missing data
+        if printer_status is None:
+            printer_status = {}
+        if job_status is None:
+            job_status = {}
+        
+        # Define safe_round function first
+        def safe_round(value, digits=1):
+            try:
+                return round(float(value), digits)
+            except (TypeError, ValueError):
+                return 0
+        
+        # Parse temperature data safely
+        temps = printer_status.get('temperature', {}) if isinstance(printer_status, dict) else {}
+        tool0 = temps.get('tool0', {})
+        bed = temps.get('bed', {})
+        
+        # Look for chamber temperature sensors in OctoPrint
+        chamber_temps = []
+        for key, temp_data in temps.items():
+            if 'chamber' in key.lower() and isinstance(temp_data, dict) and 'actual' in temp_data:
+                # Extract friendly name
+                friendly_name = key.replace('_', ' ').title()
+                chamber_temps.append({
+                    'name': friendly_name,
+                    'actual': safe_round(temp_data.get('actual', 0)),
+                    'target': safe_round(temp_data.get('target', 0)) if temp_data.get('target') is not None else None
+                })
+        
+        # Parse job data
+        job = job_status.get('job', {}) if isinstance(job_status, dict) else {}
+        progress = job_status.get('progress', {}) if isinstance(job_status, dict) else {}
+        state = printer_status.get('state', {}) if isinstance(printer_status, dict) else {}
+        
+        # Parse position data from main printer endpoint
+        position_data = printer_status.get('position', {}) if isinstance(printer_status, dict) else {}
+        position = {
+            'x': safe_round(position_data.get('x', 0), 2),
+            'y': safe_round(position_data.get('y', 0), 2),
+            'z': safe_round(position_data.get('z', 0), 2)
+        }
+        
+        # Calculate remaining time
+        remaining = progress.get('printTimeLeft') or 0
+        remaining_formatted = self._format_time(remaining) if remaining else "Unknown"
+        
+        result = {
+            'name': self.name,
+            'type': 'octoprint',
+            'online': True,
+            'state': state.get('text', 'unknown').lower() if isinstance(state, dict) else 'unknown',
+            'progress': safe_round(progress.get('completion', 0)),
+            'file': job.get('file', {}).get('name', '') if isinstance(job, dict) else '',
+            'file_uploaded': job.get('file', {}).get('date', None) if isinstance(job, dict) else None,
+            'print_time': self._format_time(progress.get('printTime', 0) or 0),
+            'remaining_time': remaining_formatted,
+            'extruder_temp': {
+                'actual': safe_round(tool0.get('actual', 0)),
+                'target': safe_round(tool0.get('target', 0))
+            },
+            'bed_temp': {
+                'actual': safe_round(bed.get('actual', 0)),
+                'target': safe_round(bed.get('target', 0))
+            },
+            'position': position,
+            'message': state.get('text', '') if isinstance(state, dict) else '',
+            'ready': state.get('flags', {}).get('ready', False) if isinstance(state, dict) else False
+        }
+        
+        # Add chamber temperatures if any were found
+        if chamber_temps:
+            result['chamber_temps'] = chamber_temps
+            
+        return result
+
     def _format_time(self, seconds):
         """Format seconds into HH:MM:SS"""
         if not seconds or seconds <= 0:
@@ -1046,24 +1821,88 @@ class OctoPrintAPI(PrinterAPI):
         }
         return self._make_request('api/printer/printhead', method='POST', data=command_data)
     
-    def reprint(self):
-        """Reprint the last completed file using OctoPrint's API"""
+    def get_thumbnail_info(self, filename):
+        """Thumbnail from OctoPrint file metadata (set by the slicer thumbnail plugins)"""
+        meta = self._make_request(f"api/files/local/{urllib.parse.quote(filename, safe='')}")
+        if not meta:
+            return None
+        thumb_path = meta.get('thumbnail')
+        if not thumb_path:
+            return {}
+        return {
+            'url': f"{self.url}/{thumb_path.lstrip('/')}",
+            'modified': meta.get('date'),
+            'size': meta.get('size')
+        }
+
+    def fetch_job_history(self, cursor):
+        """Collect prints recorded after `cursor` from OctoPrint's file list.
+
+        OctoPrint keeps no job log; each file only carries statistics about
+        its most recent print (`prints.last`), so one job per file and print
+        end time is recorded. The cursor is that end time.
+        """
+        listing = self._make_request('api/files?recursive=true')
+        if listing is None:
+            return None
+
+        jobs = []
+
+        def collect(entries):
+            for entry in entries or []:
+                if entry.get('type') == 'folder':
+                    collect(entry.get('children'))
+                    continue
+                last = (entry.get('prints') or {}).get('last') or {}
+                end_time = last.get('date')
+                if not end_time or end_time <= (cursor or 0):
+                    continue
+                print_time = last.get('printTime') or 0
+                filament = ((entry.get('gcodeAnalysis') or {}).get('filament') or {})
+                filament_used = sum((tool or {}).get('length') or 0 for tool in filament.values())
+                success = last.get('success', False)
+                jobs.append({
+                    'job_id': f"{entry.get('path')}@{end_time}",
+                    'filename': entry.get('path') or entry.get('name') or '',
+                    'status': 'completed' if success else 'cancelled',
+                    'start_time': end_time - print_time,
+                    'end_time': end_time,
+                    'print_duration': print_time,
+                    'total_duration': print_time,
+                    # Analysis gives the full file's filament; only count it for finished prints
+                    'filament_used': filament_used if success else 0
+                })
+
+        collect(listing.get('files'))
+        if jobs:
+            cursor = max(job['end_time'] for job in jobs)
+        return jobs, cursor
+
+    def reprint(self, filename=None):
+        """Reprint the last completed file using OctoPrint's API.
+
+        `filename` (an OctoPrint file path) comes from the local job index
+        when available; otherwise the current job's file is used.
+        """
         try:
-            # Get current job information to find the last printed file
-            job_status = self._make_request('api/job')
-            if not job_status:
-                return {'success': False, 'error': 'Could not get job information'}
-            
-            # Check if there's a current or recent job
-            job = job_status.get('job', {})
-            file_info = job.get('file', {})
-            filename = file_info.get('name', '')
-            
-            if not filename:
-                return {'success': False, 'error': 'No file found to reprint'}
-            
-            # Get file path for OctoPrint (usually in format "path/filename.gcode")
-            file_path = file_info.get('path', filename)
+            if filename:
+                file_path = filename
+            else:
+                # Get current job information to find the last printed file
+                job_status = self._make_request('api/job')
+                if not job_status:
+                    return {'success': False, 'error': 'Could not get job information'}
+                
+                # Check if there's a current or recent job
+                job = job_status.get('job', {})
+                file_info = job.get('file', {})
+                filename = file_info.get('name', '')
+                
+                if not filename:
+                    return {'success': False, 'error': 'No file found to reprint'}
+                
+                # Get file path for OctoPrint (usually in format "path/filename.gcode")
+                file_path = file_info.get('path', filename)
             
             logger.info(f"Attempting to reprint file: {file_path}")
             
@@ -1121,19 +1960,922 @@ class OctoPrintAPI(PrinterAPI):
             logger.error(f"Error setting temperature: {e}")
             return {'success': False, 'error': str(e)}
 
+# Versions back a ?since= delta can reach; removals older than this are
+# forgotten and clients asking from before it get a full status instead
+STATUS_DELTA_WINDOW = 10000
+
+
+class StatusSnapshot(namedtuple('StatusSnapshot', ['printers', 'timestamp', 'version', 'versions', 'removed'])):
+    """Point-in-time view of every printer's status, published by the poller.
+
+    Snapshots are never mutated after publication; readers can hand
+    `printers` straight to jsonify without copying or locking. `version`
+    increases whenever any printer's status changes, `versions` maps each
+    printer to the version at which it last changed and `removed` maps
+    printers dropped from the farm to the version they disappeared in.
+    """
+    __slots__ = ()
+
+    def changed_since(self, since):
+        """Printers whose status changed after version `since`, and printers removed since then"""
+        changed = {name: self.printers[name] for name, version in self.versions.items() if version > since}
+        removed = [name for name, version in self.removed.items() if version > since]
+        return changed, removed
+
+    def covers(self, since):
+        """Whether a delta from version `since` is still complete (nothing it needs was pruned)"""
+        return self.version - STATUS_DELTA_WINDOW <= since <= self.version
+
+    @property
+    def age(self):
+        """Seconds since this snapshot was taken"""
+        return max(0.0, time.time() - self.timestamp)
+
+
+class StatusBroadcaster:
+    """Fans status change events out to Server-Sent Events subscribers.
+
+    Each subscriber gets a bounded queue. A subscriber that falls too far
+    behind has its backlog dropped and receives a single 'resync' event,
+    telling the stream to resend a full snapshot instead.
+    """
+
+    def __init__(self, max_queue=100):
+        self.max_queue = max_queue
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        """Register a new subscriber and return its event queue"""
+        subscriber = queue.Queue(maxsize=self.max_queue)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def publish(self, event, data, event_id=None):
+        """Queue an event for every subscriber without blocking the publisher"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait((event, data, event_id))
+            except queue.Full:
+                with subscriber.mutex:
+                    subscriber.queue.clear()
+                subscriber.put_nowait(('resync', None, None))
+
+
+# Persistent telemetry segments, key map and event log
+TELEMETRY_DIR = '/data/telemetry'
+# Local index of print jobs synced from every printer
+JOB_HISTORY_DB = '/data/job_history.db'
+# Last published status snapshot, reloaded (flagged stale) at startup
+SNAPSHOT_PATH = '/data/status_snapshot.json'
+
+# Memory shared by all history buffers
+HISTORY_MEMORY_BUDGET = 16 * 1024 * 1024
+# Raw samples kept per channel: two hours at the one-second printing cadence
+HISTORY_CHANNEL_CAPACITY = 2 * 3600
+# Aggregate tiers as (bucket seconds, buckets kept): 10 s for 12 hours, 1 min for 3 days
+HISTORY_TIERS = ((10, 12 * 360), (60, 3 * 24 * 60))
+# Channels budgeted per printer: extruder, bed, their targets, progress and one chamber sensor
+HISTORY_CHANNELS_PER_PRINTER = 6
+# Floor for any buffer when large farms shrink the capacities above
+HISTORY_MIN_CAPACITY = 360
+# Samples replayed per lock acquisition when restoring history at startup
+HISTORY_RESTORE_BATCH = 5000
+# Points per channel returned by /api/history unless the client asks otherwise
+HISTORY_DEFAULT_MAX_POINTS = 1000
+
+
+class RingBuffer:
+    """Fixed-capacity time series backed by flat arrays: an 8-byte time plus
+    `columns` 4-byte values per sample"""
+
+    def __init__(self, capacity, columns=1):
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.columns = [array('f', bytes(4 * capacity)) for _ in range(columns)]
+        self.start = 0
+        self.count = 0
+
+    @staticmethod
+    def size_for(capacity, columns=1):
+        return capacity * (8 + 4 * columns)
+
+    @property
+    def first_time(self):
+        return self.times[self.start] if self.count else None
+
+    @property
+    def is_full(self):
+        return self.count == self.capacity
+
+    @property
+    def last_time(self):
+        if not self.count:
+            return None
+        return self.times[(self.start + self.count - 1) % self.capacity]
+
+    def append(self, timestamp, *values):
+        """Add a sample, overwriting the oldest once full. Out-of-order samples are dropped."""
+        if self.count and timestamp <= self.last_time:
+            return False
+        if self.count < self.capacity:
+            index = (self.start + self.count) % self.capacity
+            self.count += 1
+        else:
+            index = self.start
+            self.start = (self.start + 1) % self.capacity
+        self.times[index] = timestamp
+        for column, value in zip(self.columns, values):
+            column[index] = value
+        return True
+
+    def _ordered(self, column):
+        if self.count < self.capacity:
+            return column[:self.count]
+        return column[self.start:] + column[:self.start]
+
+    def range(self, start=None, end=None):
+        """Return (times, [column arrays]) for samples with start <= time <= end"""
+        times = self._ordered(self.times)
+        lo = 0 if start is None else bisect.bisect_left(times, start)
+        hi = len(times) if end is None else bisect.bisect_right(times, end)
+        return times[lo:hi], [self._ordered(column)[lo:hi] for column in self.columns]
+
+
+class AggregateBuffer:
+    """Mean/min/max per fixed-width time bucket, built incrementally from raw samples.
+
+    The bucket being filled lives outside the ring and is included in
+    range queries, so recent data is visible before its bucket closes.
+    """
+
+    def __init__(self, width, capacity):
+        self.width = width
+        self.ring = RingBuffer(capacity, columns=3)
+        self._bucket = None  # [start, sum, count, min, max]
+
+    @staticmethod
+    def size_for(capacity):
+        return RingBuffer.size_for(capacity, columns=3)
+
+    @property
+    def first_time(self):
+        if self.ring.count:
+            return self.ring.first_time
+        return self._bucket[0] if self._bucket else None
+
+    @property
+    def is_full(self):
+        return self.ring.is_full
+
+    def add(self, timestamp, value):
+        bucket_start = timestamp - timestamp % self.width
+        bucket = self._bucket
+        if bucket and bucket[0] == bucket_start:
+            bucket[1] += value
+            bucket[2] += 1
+            bucket[3] = min(bucket[3], value)
+            bucket[4] = max(bucket[4], value)
+            return
+        if bucket:
+            self.ring.append(bucket[0], bucket[1] / bucket[2], bucket[3], bucket[4])
+        self._bucket = [bucket_start, value, 1, value, value]
+
+    def range(self, start=None, end=None):
+        """Return (times, [means, mins, maxs]) for buckets starting within the range"""
+        times, (means, mins, maxs) = self.ring.range(start, end)
+        bucket = self._bucket
+        if bucket and (start is None or bucket[0] >= start) and (end is None or bucket[0] <= end):
+            times.append(bucket[0])
+            means.append(bucket[1] / bucket[2])
+            mins.append(bucket[3])
+            maxs.append(bucket[4])
+        return times, [means, mins, maxs]
+
+
+def history_capacity(memory_budget, printer_count):
+    """(raw capacity, tiers) per channel so `printer_count` printers fit in `memory_budget`.
+
+    Small farms get the full HISTORY_CHANNEL_CAPACITY and HISTORY_TIERS;
+    larger ones get every level scaled down by the same factor, so each
+    keeps a proportionally shorter window instead of later printers
+    getting no history at all.
+    """
+    channels = max(1, printer_count) * HISTORY_CHANNELS_PER_PRINTER
+    scale = min(1.0, memory_budget / channels / ChannelHistory.size_for())
+    capacity = max(HISTORY_MIN_CAPACITY, int(HISTORY_CHANNEL_CAPACITY * scale))
+    tiers = tuple((width, max(HISTORY_MIN_CAPACITY, int(buckets * scale))) for width, buckets in HISTORY_TIERS)
+    return capacity, tiers
+
+
+def _bucket_min_max(times, means, mins, maxs, max_points):
+    """Reduce a series to at most `max_points` equal-width time buckets.
+
+    Each bucket keeps the mean of its values together with its extremes, so
+    spikes survive downsampling.
+    """
+    if not times:
+        return times, means, mins, maxs, 0
+    first = times[0]
+    width = (times[-1] - first) / max_points or 1
+    buckets = {}
+    for t, mean, low, high in zip(times, means, mins, maxs):
+        index = min(int((t - first) / width), max_points - 1)
+        bucket = buckets.get(index)
+        if bucket is None:
+            buckets[index] = [mean, 1, low, high]
+        else:
+            bucket[0] += mean
+            bucket[1] += 1
+            if low < bucket[2]:
+                bucket[2] = low
+            if high > bucket[3]:
+                bucket[3] = high
+    out_times, out_means, out_mins, out_maxs = [], [], [], []
+    for index in sorted(buckets):
+        total, count, low, high = buckets[index]
+        out_times.append(first + index * width)
+        out_means.append(total / count)
+        out_mins.append(low)
+        out_maxs.append(high)
+    return out_times, out_means, out_mins, out_maxs, width
+
+
+class ChannelHistory:
+    """One channel's raw samples plus its 10 s and 1 min aggregate tiers"""
+
+    def __init__(self, capacity=HISTORY_CHANNEL_CAPACITY, tiers=HISTORY_TIERS):
+        self.raw = RingBuffer(capacity)
+        self.tiers = [AggregateBuffer(width, tier_capacity) for width, tier_capacity in tiers]
+
+    @staticmethod
+    def size_for(capacity=HISTORY_CHANNEL_CAPACITY, tiers=HISTORY_TIERS):
+        return RingBuffer.size_for(capacity) + sum(AggregateBuffer.size_for(c) for _, c in tiers)
+
+    def append(self, timestamp, value):
+        if self.raw.append(timestamp, value):
+            for tier in self.tiers:
+                tier.add(timestamp, value)
+
+    def query(self, start=None, end=None, max_points=None):
+        """Columnar samples for a time range, at most `max_points` of them.
+
+        Uses the finest level (raw, 10 s, 1 min) that still holds data back
+        to `start` and fits in `max_points`; if none fits, the smallest
+        covering level is min/max-bucketed down to `max_points`. Work is
+        bounded by the tier sizes, however long the range is.
+        """
+        levels = [(0, self.raw)] + [(tier.width, tier) for tier in self.tiers]
+        # A level covers the range if it has not yet overwritten anything older than `start`
+        covering = [(resolution, level) for resolution, level in levels
+                    if level.first_time is not None and (not level.is_full or start is not None and level.first_time <= start)]
+        if not covering:
+            covering = levels[-1:]
+
+        for resolution, level in covering:
+            times, columns = level.range(start, end)
+            chosen = (resolution, times, columns)
+            if not max_points or len(times) <= max_points:
+                break
+
+        resolution, times, columns = chosen
+        if len(columns) == 1:
+            means = mins = maxs = columns[0]
+        else:
+            means, mins, maxs = columns
+        if max_points and len(times) > max_points:
+            times, means, mins, maxs, resolution = _bucket_min_max(times, means, mins, maxs, max_points)
+
+        result = {
+            'timestamps': [round(t, 3) for t in times],
+            'values': [round(v, 2) for v in means],
+            'resolution': round(resolution, 3)
+        }
+        if resolution:
+            result['min'] = [round(v, 2) for v in mins]
+            result['max'] = [round(v, 2) for v in maxs]
+        return result
+
+
+class TelemetryHistory:
+    """Per-printer, per-channel temperature and progress history.
+
+    Each channel is a ChannelHistory. Buffers are allocated up front and
+    together never exceed `memory_budget` bytes; `configure()` sizes them
+    for the number of printers, and channels that would still go over the
+    budget are not recorded.
+    """
+
+    def __init__(self, memory_budget=HISTORY_MEMORY_BUDGET, store=None):
+        self.memory_budget = memory_budget
+        self.store = store
+        self.capacity = HISTORY_CHANNEL_CAPACITY
+        self.tiers = HISTORY_TIERS
+        self._series = {}
+        self._used = 0
+        self._refused = set()
+        self._restoring = False
+        self._held = []
+        self._last_job = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def extract_channels(status):
+        """Map a printer status dict to {channel: value}"""
+        channels = {}
+        for heater in ('extruder', 'bed'):
+            temps = status.get(f'{heater}_temp') or {}
+            if temps.get('actual') is not None:
+                channels[heater] = temps['actual']
+            if temps.get('target') is not None:
+                channels[f'{heater}_target'] = temps['target']
+        for sensor in status.get('chamber_temps') or []:
+            key = sensor.get('sensor_id') or sensor.get('name')
+            if key and sensor.get('actual') is not None:
+                channels[f'chamber:{key}'] = sensor['actual']
+        if status.get('progress') is not None:
+            channels['progress'] = status['progress']
+        return channels
+
+    def configure(self, printer_count):
+        """Size buffers for channels created from now on to fit `printer_count` printers"""
+        with self._lock:
+            self.capacity, self.tiers = history_capacity(self.memory_budget, printer_count)
+        if self.capacity < HISTORY_CHANNEL_CAPACITY:
+            logger.info(f"History for {printer_count} printers: {self.capacity} raw samples and "
+                        f"{', '.join(f'{c} x {w}s' for w, c in self.tiers)} buckets per channel")
+
+    def _channel(self, printer, channel):
+        series = self._series.setdefault(printer, {})
+        history = series.get(channel)
+        if history is None:
+            size = ChannelHistory.size_for(self.capacity, self.tiers)
+            if self._used + size > self.memory_budget:
+                if (printer, channel) not in self._refused:
+                    self._refused.add((printer, channel))
+                    logger.warning(f"History memory budget ({self.memory_budget // (1024 * 1024)} MiB) exhausted, "
+                                   f"not recording {printer} {channel}")
+                return None
+            history = series[channel] = ChannelHistory(self.capacity, self.tiers)
+            self._used += size
+        return history
+
+    def _record_transitions(self, printer, status, timestamp):
+        """Log state changes and job (file) changes to the store's event log"""
+        state = status.get('state')
+        job_file = status.get('file') or ''
+        previous = self._last_job.get(printer)
+        self._last_job[printer] = (state, job_file)
+        if previous is None or self.store is None:
+            return
+        previous_state, previous_file = previous
+        if state != previous_state:
+            self.store.append_event({'t': timestamp, 'printer': printer, 'event': 'state',
+                                     'from': previous_state, 'to': state, 'file': job_file})
+        if job_file != previous_file:
+            self.store.append_event({'t': timestamp, 'printer': printer, 'event': 'job',
+                                     'file': job_file, 'previous_file': previous_file})
+
+    def record(self, printer, status, timestamp=None):
+        """Append one sample per channel from an online printer's status"""
+        if not status or status.get('stale'):
+            return
+        timestamp = timestamp or time.time()
+        with self._lock:
+            self._record_transitions(printer, status, timestamp)
+            if not status.get('online'):
+                return
+            for channel, value in self.extract_channels(status).items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if self._restoring:
+                    # Buffers only take samples in time order; apply this after the older restored ones
+                    self._held.append((timestamp, printer, channel, value))
+                    if self.store is not None:
+                        self.store.append(printer, channel, timestamp, value)
+                    continue
+                history = self._channel(printer, channel)
+                if history is None:
+                    continue
+                history.append(timestamp, value)
+                if self.store is not None:
+                    self.store.append(printer, channel, timestamp, value)
+
+    def hold_live(self):
+        """Hold back live samples until the next restore() finishes"""
+        with self._lock:
+            self._restoring = True
+
+    def _append_samples(self, samples):
+        with self._lock:
+            count = 0
+            for timestamp, printer, channel, value in samples:
+                history = self._channel(printer, channel)
+                if history is not None:
+                    history.append(timestamp, value)
+                    count += 1
+            return count
+
+    def restore(self, since=None):
+        """Reload recorded samples from the on-disk store after a restart.
+
+        Samples are replayed in batches, so the lock is never held for the
+        whole replay; live samples recorded meanwhile are held back and
+        applied once it is done.
+        """
+        self.hold_live()
+        count = 0
+        try:
+            if self.store is not None:
+                if since is None:
+                    since = time.time() - max(width * capacity for width, capacity in self.tiers)
+                batch = []
+                for sample in self.store.scan(since):
+                    batch.append(sample)
+                    if len(batch) >= HISTORY_RESTORE_BATCH:
+                        count += self._append_samples(batch)
+                        batch = []
+                count += self._append_samples(batch)
+        finally:
+            with self._lock:
+                self._restoring = False
+                held, self._held = self._held, []
+                for timestamp, printer, channel, value in held:
+                    history = self._channel(printer, channel)
+                    if history is not None:
+                        history.append(timestamp, value)
+        return count
+
+    def channels(self, printer):
+        with self._lock:
+            return sorted(self._series.get(printer, {}))
+
+    def query(self, printer, channels=None, start=None, end=None, max_points=None):
+        """Columnar history: {channel: {'timestamps': [...], 'values': [...], ...}}"""
+        result = {}
+        with self._lock:
+            series = self._series.get(printer, {})
+            for channel in channels or sorted(series):
+                history = series.get(channel)
+                if history is not None:
+                    result[channel] = history.query(start, end, max_points)
+        return result
+
+
+class TelemetryStore:
+    """Append-only on-disk telemetry under TELEMETRY_DIR.
+
+    Samples are fixed-size binary records (float64 time, uint32 key,
+    float32 value) in time-ordered segment files; `keys.json` maps key ids
+    to printer/channel pairs and `events.jsonl` holds state and job
+    transitions. Samples are buffered and written in one batch every
+    `flush_interval` seconds, and a value is only written when it changes
+    or every `heartbeat` seconds, which keeps SD-card writes small. Segments
+    rotate by size or age and the oldest are deleted once the store exceeds
+    `max_bytes` or `retention` seconds. Range reads bisect the mmapped
+    segments.
+    """
+    RECORD = struct.Struct('<dIf')
+    SCAN_CHUNK = 4096  # records unpacked per slice of a segment
+    SEGMENT_SUFFIX = '.seg'
+
+    def __init__(self, directory=TELEMETRY_DIR, flush_interval=30, heartbeat=60,
+                 segment_max_bytes=4 * 1024 * 1024, segment_max_age=24 * 3600,
+                 max_bytes=64 * 1024 * 1024, retention=7 * 24 * 3600, events_max_bytes=1024 * 1024):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.heartbeat = heartbeat
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_age = segment_max_age
+        self.max_bytes = max_bytes
+        self.retention = retention
+        self.events_max_bytes = events_max_bytes
+        self.keys_path = os.path.join(directory, 'keys.json')
+        self.events_path = os.path.join(directory, 'events.jsonl')
+        self._keys = {}
+        self._key_names = {}
+        self._keys_dirty = False
+        self._last_written = {}
+        self._last_timestamp = 0
+        self._pending = []
+        self._pending_events = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._segment_path = None
+        self._segment_started = 0
+        self._running = False
+        self._thread = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            self._load_keys()
+        except Exception as e:
+            logger.error(f"Error opening telemetry store {directory}: {e}")
+
+    def _load_keys(self):
+        if os.path.exists(self.keys_path):
+            with open(self.keys_path, 'r') as f:
+                for name, key_id in json.load(f).items():
+                    printer, _, channel = name.partition('\t')
+                    self._keys[(printer, channel)] = key_id
+                    self._key_names[key_id] = (printer, channel)
+
+    def _key_id(self, printer, channel):
+        key_id = self._keys.get((printer, channel))
+        if key_id is None:
+            key_id = self._keys[(printer, channel)] = len(self._keys) + 1
+            self._key_names[key_id] = (printer, channel)
+            self._keys_dirty = True
+        return key_id
+
+    def append(self, printer, channel, timestamp, value):
+        """Queue a sample; unchanged values are skipped until the heartbeat is due"""
+        with self._lock:
+            key_id = self._key_id(printer, channel)
+            last = self._last_written.get(key_id)
+            if last and last[1] == value and timestamp - last[0] < self.heartbeat:
+                return
+            # Segments must stay time-ordered for range bisection
+            timestamp = max(timestamp, self._last_timestamp)
+            self._last_timestamp = timestamp
+            self._last_written[key_id] = (timestamp, value)
+            self._pending.append((timestamp, key_id, value))
+
+    def append_event(self, event):
+        with self._lock:
+            self._pending_events.append(event)
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._flush_loop, name='telemetry-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self.flush()
+
+    def _flush_loop(self):
+        while self._running:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        """Write everything queued since the last flush in one batch"""
+        with self._lock:
+            records, self._pending = self._pending, []
+            events, self._pending_events = self._pending_events, []
+            keys = dict(self._keys) if self._keys_dirty else None
+            self._keys_dirty = False
+        if not records and not events and keys is None:
+            return
+        with self._write_lock:
+            try:
+                if keys is not None:
+                    # Keys first, so a segment never references an unknown id
+                    tmp_path = self.keys_path + '.tmp'
+                    with open(tmp_path, 'w') as f:
+                        json.dump({f"{printer}\t{channel}": key_id for (printer, channel), key_id in keys.items()}, f)
+                    os.replace(tmp_path, self.keys_path)
+                if records:
+                    self._write_records(records)
+                if events:
+                    if os.path.exists(self.events_path) and os.path.getsize(self.events_path) > self.events_max_bytes:
+                        os.replace(self.events_path, self.events_path + '.1')
+                    with open(self.events_path, 'a') as f:
+                        f.writelines(json.dumps(event, separators=(',', ':')) + '\n' for event in events)
+                self._enforce_retention()
+            except Exception as e:
+                logger.error(f"Error writing telemetry: {e}")
+
+    def _segments(self):
+        """Segment paths with their start times, oldest first"""
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SEGMENT_SUFFIX):
+                try:
+                    segments.append((float(name[:-len(self.SEGMENT_SUFFIX)]) / 1000, os.path.join(self.directory, name)))
+                except ValueError:
+                    continue
+        return sorted(segments)
+
+    def _current_segment(self, timestamp):
+        """Path of the segment to append to, rotating by size and age"""
+        if self._segment_path is None:
+            segments = self._segments()
+            if segments:
+                self._segment_started, self._segment_path = segments[-1]
+                # Drop a torn record left by a crash mid-write
+                size = os.path.getsize(self._segment_path)
+                if size % self.RECORD.size:
+                    with open(self._segment_path, 'r+b') as f:
+                        f.truncate(size - size % self.RECORD.size)
+        if (self._segment_path is None
+                or os.path.getsize(self._segment_path) >= self.segment_max_bytes
+                or timestamp - self._segment_started >= self.segment_max_age):
+            self._segment_started = timestamp
+            self._segment_path = os.path.join(self.directory, f"{int(timestamp * 1000):013d}{self.SEGMENT_SUFFIX}")
+        return self._segment_path
+
+    def _write_records(self, records):
+        """Append records to segments, rotating as soon as one fills up or ages out"""
+        index = 0
+        while index < len(records):
+            path = self._current_segment(records[index][0])
+            used = os.path.getsize(path) if os.path.exists(path) else 0
+            room = max(1, (self.segment_max_bytes - used) // self.RECORD.size)
+            end = index + 1
+            while (end < len(records) and end - index < room
+                   and records[end][0] - self._segment_started < self.segment_max_age):
+                end += 1
+            with open(path, 'ab') as f:
+                f.write(b''.join(self.RECORD.pack(*record) for record in records[index:end]))
+            index = end
+
+    def _enforce_retention(self):
+        segments = self._segments()
+        total = sum(os.path.getsize(path) for _, path in segments)
+        cutoff = time.time() - self.retention
+        # A segment ends where the next one starts; the newest is never removed
+        while len(segments) > 1 and (total > self.max_bytes or segments[1][0] < cutoff):
+            _, path = segments.pop(0)
+            total -= os.path.getsize(path)
+            os.remove(path)
+            logger.info(f"Removed old telemetry segment {os.path.basename(path)}")
+
+    def scan(self, start=None, end=None):
+        """Yield (timestamp, printer, channel, value) for stored samples in a time range"""
+        with self._write_lock:
+            segments = self._segments()
+        size = self.RECORD.size
+        for index, (segment_start, path) in enumerate(segments):
+            next_start = segments[index + 1][0] if index + 1 < len(segments) else None
+            if end is not None and segment_start > end:
+                break
+            if start is not None and next_start is not None and next_start < start:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    count = os.fstat(f.fileno()).st_size // size
+                    if not count:
+                        continue
+                    with mmap.mmap(f.fileno(), count * size, access=mmap.ACCESS_READ) as mm:
+                        def time_at(i):
+                            return struct.unpack_from('<d', mm, i * size)[0]
+
+                        lo, hi = 0, count
+                        if start is not None:
+                            while lo < hi:
+                                mid = (lo + hi) // 2
+                                if time_at(mid) < start:
+                                    lo = mid + 1
+                                else:
+                                    hi = mid
+                        # Unpack in bounded chunks so a scan never copies a whole segment
+                        for chunk_start in range(lo, count, self.SCAN_CHUNK):
+                            chunk = mm[chunk_start * size:min(count, chunk_start + self.SCAN_CHUNK) * size]
+                            for timestamp, key_id, value in self.RECORD.iter_unpack(chunk):
+                                if end is not None and timestamp > end:
+                                    return
+                                name = self._key_names.get(key_id)
+                                if name:
+                                    yield timestamp, name[0], name[1], value
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading telemetry segment {path}: {e}")
+
+    def events(self, printer=None, start=None, end=None):
+        """State and job transitions from the event log, oldest first"""
+        self.flush()
+        events = []
+        for path in (self.events_path + '.1', self.events_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    if printer and event.get('printer') != printer:
+                        continue
+                    if start is not None and event.get('t', 0) < start:
+                        continue
+                    if end is not None and event.get('t', 0) > end:
+                        continue
+                    events.append(event)
+        return events
+
+
+class JobHistory:
+    """SQLite index of print jobs synced from every printer.
+
+    Each printer has a sync cursor so only new jobs are fetched. Jobs are
+    upserted by (printer, job_id), so in-progress jobs are updated once
+    they finish.
+    """
+    # Job statuses counted as failed in the success rate
+    FAILED_STATUSES = ('cancelled', 'error', 'klippy_shutdown', 'klippy_disconnect', 'server_exit', 'interrupted')
+
+    def __init__(self, path=JOB_HISTORY_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock, self._db:
+            # WAL with NORMAL sync keeps SD-card writes down
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute('''CREATE TABLE IF NOT EXISTS jobs (
+                printer TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                status TEXT NOT NULL,
+                start_time REAL,
+                end_time REAL,
+                print_duration REAL DEFAULT 0,
+                total_duration REAL DEFAULT 0,
+                filament_used REAL DEFAULT 0,
+                PRIMARY KEY (printer, job_id)
+            )''')
+            self._db.execute('CREATE INDEX IF NOT EXISTS jobs_printer_start ON jobs (printer, start_time)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS jobs_filename ON jobs (filename)')
+            self._db.execute('''CREATE TABLE IF NOT EXISTS sync_state (
+                printer TEXT PRIMARY KEY,
+                cursor REAL,
+                last_sync REAL
+            )''')
+
+    def get_cursor(self, printer):
+        with self._lock:
+            row = self._db.execute('SELECT cursor FROM sync_state WHERE printer = ?', (printer,)).fetchone()
+        return row['cursor'] if row else None
+
+    def store(self, printer, jobs, cursor):
+        """Upsert synced jobs and advance the printer's cursor in one transaction"""
+        with self._lock, self._db:
+            self._db.executemany('''INSERT OR REPLACE INTO jobs
+                (printer, job_id, filename, status, start_time, end_time, print_duration, total_duration, filament_used)
+                VALUES (:printer, :job_id, :filename, :status, :start_time, :end_time, :print_duration, :total_duration, :filament_used)''',
+                [dict(job, printer=printer) for job in jobs])
+            self._db.execute('INSERT OR REPLACE INTO sync_state (printer, cursor, last_sync) VALUES (?, ?, ?)',
+                             (printer, cursor, time.time()))
+
+    def last_job(self, printer):
+        """Most recently started job for a printer, or None"""
+        with self._lock:
+            row = self._db.execute('SELECT * FROM jobs WHERE printer = ? ORDER BY start_time DESC LIMIT 1',
+                                   (printer,)).fetchone()
+        return dict(row) if row else None
+
+    def stats(self, start=None, end=None):
+        """Per-printer and per-file totals for jobs started within [start, end]"""
+        if end is None:
+            end = time.time()
+        if start is None:
+            start = end - 7 * 24 * 3600
+        failed = ','.join('?' * len(self.FAILED_STATUSES))
+        totals = f'''COUNT(*) AS jobs,
+            SUM(status = 'completed') AS completed,
+            SUM(status IN ({failed})) AS failed,
+            SUM(print_duration) AS print_seconds,
+            SUM(filament_used) AS filament_mm'''
+        params = (*self.FAILED_STATUSES, start, end)
+        with self._lock:
+            printers = self._db.execute(f'''SELECT printer, {totals} FROM jobs
+                WHERE start_time BETWEEN ? AND ? GROUP BY printer ORDER BY printer''', params).fetchall()
+            files = self._db.execute(f'''SELECT filename, {totals}, COUNT(DISTINCT printer) AS printers FROM jobs
+                WHERE start_time BETWEEN ? AND ? GROUP BY filename ORDER BY jobs DESC''', params).fetchall()
+            syncs = {row['printer']: row['last_sync'] for row in self._db.execute('SELECT printer, last_sync FROM sync_state')}
+
+        window = max(1.0, end - start)
+
+        def summarize(row):
+            finished = (row['completed'] or 0) + (row['failed'] or 0)
+            print_seconds = row['print_seconds'] or 0
+            return {
+                'jobs': row['jobs'],
+                'completed': row['completed'] or 0,
+                'failed': row['failed'] or 0,
+                'success_rate': round((row['completed'] or 0) / finished * 100, 1) if finished else None,
+                'print_hours': round(print_seconds / 3600, 2),
+                'filament_m': round((row['filament_mm'] or 0) / 1000, 2)
+            }
+
+        per_printer = {}
+        for row in printers:
+            summary = summarize(row)
+            summary['utilization'] = round(min(1.0, (row['print_seconds'] or 0) / window) * 100, 1)
+            summary['last_sync'] = syncs.get(row['printer'])
+            per_printer[row['printer']] = summary
+        per_file = {}
+        for row in files:
+            summary = summarize(row)
+            summary['printers'] = row['printers']
+            per_file[row['filename']] = summary
+        return {'from': start, 'to': end, 'printers': per_printer, 'files': per_file}
+
+
 class PrinterManager:
     """Manages multiple printer connections and status updates"""
-    
+
+    # States that get the fast poll cadence (OctoPrint reports e.g. 'printing from sd')
+    ACTIVE_STATES = ('printing', 'paused', 'pausing', 'resuming', 'cancelling', 'finishing', 'startup')
+
     def __init__(self):
         self.printers = {}
         self.status_cache = {}
         self.last_update = {}
-        self.update_interval = 5  # seconds
+        self.active_interval = 1  # seconds between polls while printing/paused
+        self.idle_interval = 30  # seconds between polls while idle
+        self.offline_interval = 5  # first retry delay for an offline printer
+        self.offline_max_interval = 300  # offline backoff cap
+        self.urgent_window = 15  # seconds of fast polling after a control action
         self.running = False
+        self.bootstrapping = False
         self.update_thread = None
-        
-    def add_printer(self, config):
-        """Add a printer from configuration"""
+        self.max_workers = 8
+        self.printer_deadline = 8  # seconds a single printer poll may take
+        self.sweep_deadline = 15  # seconds a whole farm sweep may take
+        self._executor = None
+        # Separate from the status pool so image downloads never delay a poll
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='thumbnail-prefetch')
+        self._inflight = {}
+        self._poll_started = {}
+        self._snapshot = None
+        self._snapshot_ready = threading.Event()
+        self.events = StatusBroadcaster()
+        self.telemetry = TelemetryStore()
+        self.history = TelemetryHistory(store=self.telemetry)
+        self.jobs = JobHistory()
+        self.snapshot_save_interval = 30  # seconds between snapshot saves
+        self._saved_version = None
+        self._last_save = 0
+        self.job_sync_interval = 300  # seconds between job history syncs
+        self.job_sync_thread = None
+        self._job_sync_event = threading.Event()
+        self._epoch = f"{int(time.time()):x}"
+        self._wake_event = threading.Event()
+        self._snapshot_lock = threading.Lock()
+        self._next_poll = {}
+        self._offline_polls = {}
+        self._urgent_until = {}
+        self._stale_marked = set()
+
+    def load_printers(self, configs):
+        """Replace all printers, constructing the clients in parallel.
+
+        Clients are added in configuration order once all are built.
+        Websocket clients connect in the background after construction.
+        """
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='printer-init') as executor:
+            printers = list(executor.map(self._create_printer, configs))
+        self.printers.clear()
+        for printer in printers:
+            if printer is not None:
+                self.printers[printer.name] = printer
+        self.history.configure(len(self.printers))
+        logger.info(f"Loaded {len(self.printers)} printers in {time.time() - started:.2f}s")
+
+    def bootstrap(self, load_configs):
+        """Start up without blocking the HTTP server.
+
+        The configuration is read and the saved snapshot loaded for the
+        configured printers right away, so the first requests are answered
+        from it; printer clients are then built and the poller started on a
+        background thread.
+        """
+        self.bootstrapping = True
+        configs = load_configs()
+        self.load_snapshot(names={config.get('name') for config in configs})
+
+        def run():
+            try:
+                self.load_printers(configs)
+                mark_startup('printers_loaded')
+                self.start()
+            except Exception as e:
+                logger.error(f"Startup failed: {e}")
+            finally:
+                self.bootstrapping = False
+
+        threading.Thread(target=run, name='bootstrap', daemon=True).start()
+
+    def _create_printer(self, config):
+        """Build the API client for one printer configuration, or None if invalid"""
         name = config.get('name')
         printer_type = config.get('type', 'klipper').lower()
         url = config.get('url')
@@ -1141,7 +2883,7 @@ class PrinterManager:
         
         if not name or not url:
             logger.error(f"Invalid printer config: {config}")
-            return False
+            return None
             
         try:
             if printer_type in ['klipper', 'moonraker']:
@@ -1156,39 +2898,420 @@ class PrinterManager:
                 printer = OctoPrintAPI(name, 'octoprint', url, api_key)
             else:
                 logger.error(f"Unsupported printer type: {printer_type}")
-                return False
+                return None
                 
-            self.printers[name] = printer
             logger.info(f"Added printer: {name} ({printer_type})")
-            return True
+            return printer
             
         except Exception as e:
             logger.error(f"Error adding printer {name}: {e}")
-            return False
+            return None
     
+    def _get_executor(self):
+        """Return the bounded worker pool used for status fan-out"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='status-worker')
+        return self._executor
+
+    def _poll_printer(self, name, printer):
+        """Fetch one printer's status; runs on the worker pool"""
+        self._poll_started[name] = time.time()
+        try:
+            status = self.fetch_status(name, printer)
+            previous = self.status_cache.get(name) or {}
+            if previous.get('file') and previous.get('state') != status.get('state'):
+                # A job may have just finished: sync history without waiting for the interval
+                self._job_sync_event.set()
+            if status.get('file') and (status.get('file') != previous.get('file') or
+                                       self._is_active(status) and not self._is_active(previous)):
+                # A new job: its file may have been replaced under the same name
+                forget_thumbnail_version(name, status['file'])
+                self._prefetch_thumbnail(name, printer, status['file'])
+            self.status_cache[name] = status
+            self.last_update[name] = datetime.now()
+            self.history.record(name, status)
+            return status
+        except Exception as e:
+            logger.error(f"Error getting status for {name}: {e}")
+            return {
+                'name': name,
+                'online': False,
+                'state': 'error',
+                'error': str(e)
+            }
+        finally:
+            self._poll_started.pop(name, None)
+
+    def _is_active(self, status):
+        return (status.get('state') or '').lower().startswith(self.ACTIVE_STATES)
+
+    def _prefetch_thumbnail(self, name, printer, filename):
+        """Warm the thumbnail cache for a newly started job in the background,
+        so /api/thumbnail serves it from memory when the cards ask for it"""
+        self._prefetch_executor.submit(
+            upstream_flights.do, (name, 'thumbnail', filename), _fetch_job_thumbnail, printer, filename
+        )
+
+    def _stale_status(self, name):
+        """Last known status for a printer that missed its deadline, flagged stale"""
+        last = self.status_cache.get(name)
+        if last:
+            status = dict(last)
+        else:
+            status = {
+                'name': name,
+                'online': False,
+                'state': 'offline',
+                'error': 'Status update timed out'
+            }
+        status['stale'] = True
+        return status
+
     def get_all_status(self):
-        """Get status for all printers"""
+        """Get status for all printers.
+
+        Printers are polled concurrently on a bounded worker pool. Each printer
+        gets `printer_deadline` seconds from the moment its poll starts and the
+        whole sweep is cut off after `sweep_deadline` seconds. Printers that miss
+        either deadline report their last known status flagged `stale`; their
+        poll keeps running and its result is picked up by a later sweep.
+        """
+        executor = self._get_executor()
+        futures = {}
+        for name, printer in list(self.printers.items()):
+            future = self._inflight.get(name)
+            if future is None or future.done():
+                future = executor.submit(self._poll_printer, name, printer)
+                self._inflight[name] = future
+            futures[future] = name
+
+        sweep_deadline = time.time() + self.sweep_deadline
+        pending = set(futures)
+        while pending:
+            now = time.time()
+            wake_at = sweep_deadline
+            for future in list(pending):
+                started = self._poll_started.get(futures[future])
+                if started is None:
+                    continue
+                if now - started >= self.printer_deadline:
+                    pending.discard(future)
+                else:
+                    wake_at = min(wake_at, started + self.printer_deadline)
+            if not pending or now >= sweep_deadline:
+                break
+            _, pending = wait(pending, timeout=wake_at - now, return_when=FIRST_COMPLETED)
+
         results = {}
-        for name, printer in self.printers.items():
+        for future, name in futures.items():
+            if future.done():
+                results[name] = future.result()
+            else:
+                logger.warning(f"Status for {name} missed its deadline, serving last known status")
+                results[name] = self._stale_status(name)
+        self._publish_snapshot(results)
+        return results
+
+    def _publish_snapshot(self, results):
+        """Atomically replace the shared status snapshot and announce what changed.
+
+        The snapshot version only moves when a printer's status actually
+        changes, so an idle farm keeps serving the same version (and ETag).
+        """
+        with self._snapshot_lock:
+            self._publish_locked(results)
+
+    def _publish_updates(self, updates):
+        """Merge a subset of printer statuses into the current snapshot and publish it"""
+        with self._snapshot_lock:
+            previous = self._snapshot.printers if self._snapshot else {}
+            results = {name: previous[name] for name in self.printers if name in previous}
+            results.update({name: status for name, status in updates.items() if name in self.printers})
+            self._publish_locked(results)
+
+    def _publish_locked(self, results):
+        previous = self._snapshot
+        previous_printers = previous.printers if previous else {}
+        version = previous.version if previous else 0
+        versions = dict(previous.versions) if previous else {}
+        removed = dict(previous.removed) if previous else {}
+
+        changed = {name: status for name, status in results.items() if previous_printers.get(name) != status}
+        dropped = [name for name in previous_printers if name not in results]
+        if changed or dropped:
+            version += 1
+            for name in changed:
+                versions[name] = version
+                removed.pop(name, None)
+            for name in dropped:
+                versions.pop(name, None)
+                removed[name] = version
+            removed = {name: at for name, at in removed.items() if at >= version - STATUS_DELTA_WINDOW}
+
+        self._snapshot = StatusSnapshot(results, time.time(), version, versions, removed)
+        self._snapshot_ready.set()
+
+        if changed:
+            self.events.publish('status', changed, self.snapshot_etag(self._snapshot))
+        if dropped:
+            self.events.publish('removed', dropped, self.snapshot_etag(self._snapshot))
+
+    def snapshot_etag(self, snapshot):
+        """Opaque tag for a snapshot version, unique across add-on restarts"""
+        return f"{self._epoch}-{snapshot.version}"
+
+    def _poll_interval(self, name, status):
+        """Seconds until a printer should be polled again, based on its last status.
+
+        Printing printers are polled every `active_interval`, idle ones every
+        `idle_interval` and offline ones back off exponentially from
+        `offline_interval` up to `offline_max_interval`. Live-connected
+        printers are read from their local model, which costs nothing
+        upstream, so they always get the fast cadence.
+        """
+        if not status.get('online', False) and status.get('state') in ('offline', 'error'):
+            failures = self._offline_polls.get(name, 0) + 1
+            self._offline_polls[name] = failures
+            return min(self.offline_max_interval, self.offline_interval * 2 ** (failures - 1))
+
+        self._offline_polls.pop(name, None)
+        printer = self.printers.get(name)
+        if getattr(printer, 'is_live', False):
+            return self.active_interval
+        if time.time() < self._urgent_until.get(name, 0):
+            return self.active_interval
+        state = (status.get('state') or '').lower()
+        if state.startswith(self.ACTIVE_STATES):
+            return self.active_interval
+        return self.idle_interval
+
+    def request_refresh(self, name=None):
+        """Poll a printer (or every printer) right away and keep it on the fast
+        cadence for `urgent_window` seconds, so the result of a control action
+        shows up without waiting for the idle interval."""
+        names = [name] if name else list(self.printers)
+        now = time.time()
+        for printer_name in names:
+            self._next_poll[printer_name] = now
+            self._urgent_until[printer_name] = now + self.urgent_window
+            self._offline_polls.pop(printer_name, None)
+        self._wake_event.set()
+
+    def _on_poll_done(self, name, future):
+        """Record a scheduled poll's result and work out when to poll again"""
+        try:
+            status = future.result()
+        except Exception as e:
+            status = {'name': name, 'online': False, 'state': 'error', 'error': str(e)}
+        self._stale_marked.discard(name)
+        self._next_poll[name] = time.time() + self._poll_interval(name, status)
+        try:
+            self._publish_updates({name: status})
+        except Exception as e:
+            logger.error(f"Error publishing status for {name}: {e}")
+        self._wake_event.set()
+
+    def _poll_due(self):
+        """Start polls for every printer whose next poll time has passed.
+
+        Returns the number of seconds until the next printer falls due or an
+        in-flight poll reaches its deadline.
+        """
+        executor = self._get_executor()
+        now = time.time()
+        wake_at = now + self.idle_interval
+        for name, printer in list(self.printers.items()):
+            future = self._inflight.get(name)
+            if future is not None and not future.done():
+                started = self._poll_started.get(name)
+                if started is None:
+                    continue
+                deadline = started + self.printer_deadline
+                if now >= deadline:
+                    if name not in self._stale_marked:
+                        logger.warning(f"Status for {name} missed its deadline, serving last known status")
+                        self._stale_marked.add(name)
+                        self._publish_updates({name: self._stale_status(name)})
+                else:
+                    wake_at = min(wake_at, deadline)
+                continue
+
+            due = self._next_poll.get(name, 0)
+            if due <= now:
+                future = executor.submit(self._poll_printer, name, printer)
+                self._inflight[name] = future
+                future.add_done_callback(lambda f, name=name: self._on_poll_done(name, f))
+            else:
+                wake_at = min(wake_at, due)
+        return max(0.1, wake_at - time.time())
+
+    def save_snapshot(self, path=SNAPSHOT_PATH):
+        """Write the current snapshot to disk if it changed since the last save"""
+        snapshot = self._snapshot
+        self._last_save = time.time()
+        if snapshot is None or snapshot.version == self._saved_version:
+            return
+        try:
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'timestamp': snapshot.timestamp, 'printers': snapshot.printers}, f)
+            # Replace atomically so a crash never leaves a truncated snapshot
+            os.replace(tmp_path, path)
+            self._saved_version = snapshot.version
+        except Exception as e:
+            logger.error(f"Error saving status snapshot: {e}")
+
+    def load_snapshot(self, path=SNAPSHOT_PATH, names=None):
+        """Serve the snapshot saved before the last restart until live data arrives.
+
+        Only printers in `names` (default: the loaded printers) are restored.
+        Every restored status is flagged `stale` and `restored`, and the
+        snapshot keeps its original timestamp so X-Status-Age shows how old
+        it is. Live polls replace entries as they complete.
+        """
+        if self._snapshot is not None or not os.path.exists(path):
+            return False
+        if names is None:
+            names = set(self.printers)
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+            printers = {
+                name: dict(status, stale=True, restored=True)
+                for name, status in saved.get('printers', {}).items()
+                if name in names
+            }
+            if not printers:
+                return False
+            with self._snapshot_lock:
+                if self._snapshot is not None:
+                    return False
+                for name, status in printers.items():
+                    self.status_cache.setdefault(name, status)
+                self._snapshot = StatusSnapshot(printers, saved.get('timestamp', 0), 1,
+                                                {name: 1 for name in printers}, {})
+                self._snapshot_ready.set()
+            logger.info(f"Restored last known status for {len(printers)} printers "
+                        f"({self._snapshot.age:.0f}s old)")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading saved status snapshot: {e}")
+            return False
+
+    def start(self):
+        """Start the background status poller"""
+        if self.running:
+            return
+        self.load_snapshot()
+        self.running = True
+        self.update_thread = threading.Thread(target=self._update_loop, name='status-poller', daemon=True)
+        self.update_thread.start()
+        self.job_sync_thread = threading.Thread(target=self._job_sync_loop, name='job-history-sync', daemon=True)
+        self.job_sync_thread.start()
+        logger.info(f"Status poller started (printing: {self.active_interval}s, idle: {self.idle_interval}s)")
+
+    def stop(self):
+        """Stop the background status poller"""
+        self.running = False
+        self._wake_event.set()
+        if self.update_thread:
+            self.update_thread.join(timeout=5)
+            self.update_thread = None
+        try:
+            self.save_snapshot()
+        finally:
+            # Write out the batched samples and events, or a restart loses up to a flush interval
+            self.telemetry.stop()
+
+    def _update_loop(self):
+        """Sweep every printer once, then poll each on its own state-based schedule.
+
+        Upstream load scales with the number of active printers: idle and
+        offline printers are only touched when their (longer) interval expires.
+        """
+        # Bring back history recorded before the restart on its own thread, so
+        # the first sweep does not wait for the replay
+        self.history.hold_live()
+        threading.Thread(target=self._restore_history, name='history-restore', daemon=True).start()
+        self.telemetry.start()
+
+        try:
+            results = self.get_all_status()
+            mark_startup('first_sweep')
+            now = time.time()
+            for name, status in results.items():
+                self._next_poll[name] = now + self._poll_interval(name, status)
+        except Exception as e:
+            logger.error(f"Status poller sweep failed: {e}")
+
+        while self.running:
+            # Clear before scanning so a wake-up during the scan is not lost
+            self._wake_event.clear()
             try:
-                status = printer.get_status()
-                results[name] = status
-                self.status_cache[name] = status
-                self.last_update[name] = datetime.now()
+                timeout = self._poll_due()
             except Exception as e:
-                logger.error(f"Error getting status for {name}: {e}")
-                results[name] = {
-                    'name': name,
-                    'online': False,
-                    'state': 'error',
-                    'error': str(e)
-                }
-        return results
-    
+                logger.error(f"Status poller failed: {e}")
+                timeout = self.active_interval
+            if time.time() - self._last_save >= self.snapshot_save_interval:
+                self.save_snapshot()
+            self._wake_event.wait(timeout)
+
+    def _restore_history(self):
+        try:
+            restored = self.history.restore()
+            logger.info(f"Restored {restored} telemetry samples from {self.telemetry.directory}")
+        except Exception as e:
+            logger.error(f"Error restoring telemetry history: {e}")
+
+    def sync_job_history(self, name, printer):
+        """Pull jobs recorded since the printer's cursor into the local index"""
+        cursor = self.jobs.get_cursor(name)
+        fetched = printer.fetch_job_history(cursor)
+        if fetched is None:
+            return False
+        jobs, cursor = fetched
+        self.jobs.store(name, jobs, cursor)
+        if jobs:
+            logger.info(f"Synced {len(jobs)} jobs from {name}")
+        return True
+
+    def _job_sync_loop(self):
+        """Sync every online printer's job history periodically and after jobs end"""
+        self._snapshot_ready.wait(60)
+        while self.running:
+            snapshot = self._snapshot
+            for name, printer in list(self.printers.items()):
+                status = snapshot.printers.get(name) if snapshot else None
+                if not status or not status.get('online'):
+                    continue
+                try:
+                    self.sync_job_history(name, printer)
+                except Exception as e:
+                    logger.error(f"Error syncing job history for {name}: {e}")
+            self._job_sync_event.wait(self.job_sync_interval)
+            self._job_sync_event.clear()
+
+    def get_snapshot(self, timeout=30):
+        """Return the latest published snapshot.
+
+        Blocks until the first sweep completes (up to `timeout` seconds). If the
+        poller is not running a sweep is done inline so callers always get data.
+        """
+        if self._snapshot is None:
+            if self.running or self.bootstrapping:
+                self._snapshot_ready.wait(timeout)
+            else:
+                self.get_all_status()
+        return self._snapshot or StatusSnapshot({}, time.time(), 0, {}, {})
+
+    def fetch_status(self, name, printer):
+        """Query a printer's status upstream, sharing an in-flight query with concurrent callers"""
+        return upstream_flights.do((name, 'status'), printer.get_status)
+
     def get_printer_status(self, name):
         """Get status for a specific printer"""
         if name in self.printers:
-            return self.printers[name].get_status()
+            return self.fetch_status(name, self.printers[name])
         return None
     
     def control_printer(self, name, action, **kwargs):
@@ -1205,7 +3328,8 @@ class PrinterManager:
             elif action == 'cancel':
                 result = printer.cancel_print()
             elif action == 'reprint':
-                result = printer.reprint()
+                last_job = self.jobs.last_job(name)
+                result = printer.reprint(last_job['filename'] if last_job else None)
             elif action == 'home':
                 axes = kwargs.get('axes')
                 result = printer.home_printer(axes)
@@ -1224,7 +3348,9 @@ class PrinterManager:
                 result = printer.set_temperature(heater_type, temperature, heater_name)
             else:
                 return {'success': False, 'error': 'Invalid action'}
-                
+            
+            # Pick up the printer's reaction on the fast cadence
+            self.request_refresh(name)
             return {'success': True, 'result': result}
             
         except Exception as e:
@@ -1249,15 +3375,6 @@ class PrinterStorage:
             logger.info("Running in production mode, using /data/options.json")
         
         logger.info(f"PrinterStorage initialized with config file: {self.config_file}")
-        self._load_printers()
-    
-    def _load_printers(self):
-        """Load and initialize printers from configuration"""
-        printers_config = self.get_printers()
-        printer_manager.printers.clear()
-        
-        for printer_config in printers_config:
-            printer_manager.add_printer(printer_config)
     
     def get_printers(self):
         """Load printers from configuration file"""
@@ -1344,6 +3461,12 @@ class HomeAssistantAPI:
         # For camera URLs that browsers need to access, we need the external HA URL
         # Try to determine the external URL from the request context
         self.external_url = None
+
+        # Keep-alive session to the supervisor proxy, authenticated once
+        self.session = create_http_session({
+            'Authorization': f'Bearer {self.token}',
+            'Cache-Control': 'no-cache'
+        })
         
         logger.info(f"HomeAssistantAPI initialized with internal URL: {self.internal_url}")
         logger.info(f"Supervisor token available: {'Yes' if self.token else 'No'}")
@@ -1389,12 +3512,6 @@ class HomeAssistantAPI:
     def _make_request(self, endpoint, method='GET', data=None, timeout=10):
         """Make HTTP request to Home Assistant API using internal URL"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.token}',
-                'Content-Type': 'application/json',
-                'Cache-Control': 'no-cache'
-            }
-            
             url = f"{self.internal_url}/api/{endpoint.lstrip('/')}"
             
             # Add cache-busting parameter for state requests
@@ -1402,9 +3519,9 @@ class HomeAssistantAPI:
                 url += f"?_={int(time.time() * 1000)}"
             
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=timeout)
+                response = self.session.get(url, timeout=timeout)
             elif method == 'POST':
-                response = requests.post(url, headers=headers, json=data, timeout=timeout)
+                response = self.session.post(url, json=data, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported method: {method}")
                 
@@ -1487,11 +3604,7 @@ class HomeAssistantAPI:
             else:
                 url = f"{self.internal_url}{entity_picture}"
 
-            headers = {
-                'Authorization': f'Bearer {self.token}',
-                'Cache-Control': 'no-cache',
-            }
-            response = requests.get(url, headers=headers, timeout=15, stream=False)
+            response = self.session.get(url, timeout=15, stream=False)
             response.raise_for_status()
             content_type = response.headers.get('Content-Type', 'image/jpeg')
             return response.content, content_type
@@ -1559,30 +3672,186 @@ def get_printers():
         logger.error(f"Traceback: {traceback.format_exc()}")
         return jsonify([]), 500
 
+def _with_snapshot_headers(response, snapshot):
+    """Tag a status response with the age of the snapshot it was served from"""
+    response.headers['X-Status-Age'] = f"{snapshot.age:.3f}"
+    response.headers['X-Status-Timestamp'] = f"{snapshot.timestamp:.3f}"
+    response.headers['X-Status-Version'] = printer_manager.snapshot_etag(snapshot)
+    return response
+
 @app.route('/api/status')
 def get_all_status():
-    """API endpoint to get status for all printers"""
+    """API endpoint to get status for all printers.
+
+    Supports If-None-Match against the snapshot ETag (304 when nothing has
+    changed) and `?since=<version>`, which returns only the printers that
+    changed after that version along with the new version.
+    """
     try:
-        status = printer_manager.get_all_status()
-        logger.debug(f"API: Returning status for {len(status)} printers")
-        return jsonify(status)
+        snapshot = printer_manager.get_snapshot()
+
+        since = request.args.get('since')
+        if since is not None:
+            # Delta mode: only printers that changed after the client's version
+            since_version = _parse_status_version(since)
+            full = since_version is None or not snapshot.covers(since_version)
+            if full:
+                changed, removed = snapshot.printers, []
+            else:
+                changed, removed = snapshot.changed_since(since_version)
+            logger.debug(f"API: Returning {len(changed)} changed printers since {since}")
+            return _with_snapshot_headers(jsonify({
+                'version': printer_manager.snapshot_etag(snapshot),
+                'full': full,
+                'printers': changed,
+                'removed': removed
+            }), snapshot)
+
+        response = _with_snapshot_headers(jsonify(snapshot.printers), snapshot)
+        response.set_etag(printer_manager.snapshot_etag(snapshot))
+        logger.debug(f"API: Returning status for {len(snapshot.printers)} printers")
+        return response.make_conditional(request)
     except Exception as e:
         logger.error(f"Error in get_all_status API: {e}")
         return jsonify({}), 500
 
+# Seconds between SSE keepalive comments; keeps proxies from timing out idle streams
+SSE_KEEPALIVE_INTERVAL = 15
+# Each open event stream holds a server thread, so cap them; extra clients poll instead
+SSE_MAX_CLIENTS = 10
+
+
+def _sse_message(event, data, event_id=None):
+    """Format one Server-Sent Events message"""
+    message = f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+    if event_id:
+        message = f"id: {event_id}\n" + message
+    return message
+
+
+def _parse_status_version(tag):
+    """Return the version encoded in a status tag from this process, or None.
+
+    Tags from before a restart carry a different epoch and are rejected so
+    the client gets a full snapshot.
+    """
+    epoch, _, version = (tag or '').strip('"').rpartition('-')
+    if epoch != printer_manager._epoch:
+        return None
+    try:
+        return int(version)
+    except ValueError:
+        return None
+
+@app.route('/api/events')
+def status_events():
+    """Server-Sent Events stream of printer status.
+
+    Sends a `snapshot` event with every printer's status on connect, then a
+    `status` event containing only the printers whose status changed each
+    time the poller publishes, and a `removed` event listing printers
+    dropped from the farm.
+    """
+    if printer_manager.events.subscriber_count >= SSE_MAX_CLIENTS:
+        return jsonify({'error': 'Too many event stream clients, use /api/status'}), 503
+
+    last_event_id = request.headers.get('Last-Event-ID', '')
+
+    def stream():
+        subscriber = printer_manager.events.subscribe()
+        try:
+            yield "retry: 5000\n\n"
+            snapshot = printer_manager.get_snapshot()
+            since = _parse_status_version(last_event_id)
+            if since is not None and snapshot.covers(since):
+                # Reconnecting client: only send what it missed
+                changed, removed = snapshot.changed_since(since)
+                yield _sse_message('status', changed, printer_manager.snapshot_etag(snapshot))
+                if removed:
+                    yield _sse_message('removed', removed, printer_manager.snapshot_etag(snapshot))
+            else:
+                yield _sse_message('snapshot', snapshot.printers, printer_manager.snapshot_etag(snapshot))
+            while True:
+                try:
+                    event, data, event_id = subscriber.get(timeout=SSE_KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if event == 'resync':
+                    snapshot = printer_manager.get_snapshot()
+                    event, data, event_id = 'snapshot', snapshot.printers, printer_manager.snapshot_etag(snapshot)
+                yield _sse_message(event, data, event_id)
+        finally:
+            printer_manager.events.unsubscribe(subscriber)
+
+    response = Response(stream(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/api/status/<printer_name>')
 def get_printer_status(printer_name):
     """API endpoint to get status for a specific printer"""
     try:
-        status = printer_manager.get_printer_status(printer_name)
+        snapshot = printer_manager.get_snapshot()
+        status = snapshot.printers.get(printer_name)
         if status:
-            return jsonify(status)
+            return _with_snapshot_headers(jsonify(status), snapshot)
         else:
             return jsonify({'error': 'Printer not found'}), 404
     except Exception as e:
         logger.error(f"Error getting status for {printer_name}: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/history/<printer_name>')
+def get_printer_history(printer_name):
+    """Recorded temperature and progress history for a printer.
+
+    Query parameters: `channels` (comma separated, default all), `from` and
+    `to` (unix timestamps), `max_points` per channel and `events=1` to include
+    recorded state and job transitions. Each channel is
+    returned as parallel `timestamps` and `values` arrays; when the data
+    comes from an aggregate tier or was downsampled, `min` and `max` arrays
+    are included and `resolution` gives the bucket width in seconds.
+    """
+    if printer_name not in printer_manager.printers:
+        return jsonify({'error': 'Printer not found'}), 404
+    try:
+        start = request.args.get('from', type=float)
+        end = request.args.get('to', type=float)
+        max_points = request.args.get('max_points', HISTORY_DEFAULT_MAX_POINTS, type=int)
+        max_points = max(1, min(max_points, HISTORY_CHANNEL_CAPACITY))
+        channels = [c.strip() for c in request.args.get('channels', '').split(',') if c.strip()]
+        history = printer_manager.history.query(printer_name, channels or None, start, end, max_points)
+        result = {
+            'printer': printer_name,
+            'available_channels': printer_manager.history.channels(printer_name),
+            'channels': history
+        }
+        if request.args.get('events', '').lower() in ('1', 'true', 'yes'):
+            result['events'] = printer_manager.telemetry.events(printer_name, start, end)
+        return jsonify(result)
+    except Exception as e:
+        logger.error(f"Error getting history for {printer_name}: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/farm/stats')
+def get_farm_stats():
+    """Print statistics from the local job index.
+
+    Per printer: jobs, success rate, print hours, filament and utilization
+    (print time as a share of the window). Per file: the same totals plus
+    how many printers ran it. `from`/`to` are unix timestamps; the default
+    window is the last seven days.
+    """
+    try:
+        start = request.args.get('from', type=float)
+        end = request.args.get('to', type=float)
+        return jsonify(printer_manager.jobs.stats(start, end))
+    except Exception as e:
+        logger.error(f"Error getting farm stats: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/control/<printer_name>/<action>', methods=['POST'])
 def control_printer(printer_name, action):
     """API endpoint to control a printer"""
@@ -1700,6 +3969,8 @@ def run_printer_macro(printer_name):
         result = printer.run_macro(macro_name)
         if result is None:
             return jsonify({'success': False, 'error': 'Macro execution failed'}), 500
+        # Pick up the printer's reaction on the fast cadence
+        printer_manager.request_refresh(printer_name)
         return jsonify({'success': True, 'result': result})
     except Exception as e:
         logger.error(f"Error running macro on {printer_name}: {e}")
@@ -1851,8 +4122,10 @@ def health_check():
     logger.info(f"Number of printers: {len(printer_manager.printers)}")
     
     health_data = {
-        'status': 'healthy', 
+        'status': 'healthy',
         'printers_count': len(printer_manager.printers),
+        'starting': printer_manager.bootstrapping,
+        'startup': startup_timings,
         'last_update': max(printer_manager.last_update.values()).isoformat() if printer_manager.last_update else None,
         'request_info': {
             'url': request.url,
@@ -2062,6 +4335,10 @@ def get_camera_snapshot(printer_name):
         logger.error(f"Traceback: {traceback.format_exc()}")
         return jsonify({'error': str(e)}), 500
 
+# Camera frames fetched within this window are reused for other viewers
+CAMERA_SHARE_SECONDS = 1
+
+
 @app.route('/api/camera/<printer_name>/proxy')
 def proxy_camera_image(printer_name):
     """Stream the camera image bytes through the addon (works on HA 2024+)."""
@@ -2075,7 +4352,10 @@ def proxy_camera_image(printer_name):
         if not camera_entity:
             return jsonify({'error': 'No camera entity configured for this printer'}), 404
 
-        image_bytes, content_type = ha_api.fetch_camera_image(camera_entity)
+        # Every viewer polls the camera; concurrent and back-to-back requests share one fetch
+        image_bytes, content_type = upstream_flights.do(
+            (printer_name, 'camera'), ha_api.fetch_camera_image, camera_entity, share_for=CAMERA_SHARE_SECONDS
+        )
         if not image_bytes:
             return jsonify({'error': 'Camera image not available'}), 502
 
@@ -2113,6 +4393,7 @@ def test_gcode(printer_name):
                                          data={'script': gcode})
         
         logger.info(f"G-code test result: {result}")
+        printer_manager.request_refresh(printer_name)
         
         return jsonify({
             'success': True, 
@@ -2476,18 +4757,281 @@ def test_moonraker_connection(host, port, timeout=1):
     except Exception:
         return False
 
-# Helper to fetch and proxy remote thumbnail images
 
-def _proxy_thumbnail(remote_url: str, headers=None, timeout: int = 10):
-    """Fetch a remote image and return (bytes, content_type) or (None, None) on failure."""
+# Printer thumbnails: bytes kept in memory, and on disk across restarts
+THUMBNAIL_CACHE_DIR = '/data/thumbnail_cache'
+THUMBNAIL_MEMORY_BYTES = 16 * 1024 * 1024
+THUMBNAIL_DISK_BYTES = 128 * 1024 * 1024
+# How long a file's known version is trusted before its metadata is re-checked
+THUMBNAIL_VERSION_TTL = 600
+# Printer files whose version is remembered
+THUMBNAIL_VERSION_ENTRIES = 1024
+
+
+class MemoryLRUCache:
+    """Size-bounded in-memory LRU; values are measured with `sizeof` (bytes by default)"""
+
+    def __init__(self, max_bytes, sizeof=len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if self.sizeof(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= self.sizeof(old)
+            self._items[key] = value
+            self.size += self.sizeof(value)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= self.sizeof(evicted)
+
+    def pop(self, key):
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is not None:
+                self.size -= self.sizeof(value)
+            return value
+
+
+class DiskLRUCache:
+    """Byte-bounded directory of cached files, evicting the least recently used.
+
+    Reads bump a file's mtime, so eviction order follows use.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def put(self, key, data):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            with self._lock:
+                existing = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(tmp_path, path)
+                self.size += len(data) - existing
+                if self.size > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            logger.error(f"Error writing cache file {path}: {e}")
+
+    def _evict(self):
+        """Remove least recently used files until the cache is at 90% of its budget"""
+        entries = sorted((entry for entry in os.scandir(self.directory) if entry.is_file()),
+                         key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if self.size <= self.max_bytes * 0.9:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self.size -= size
+            except OSError:
+                continue
+
+
+class ThumbnailCache:
+    """Memory LRU in front of a disk cache for immutable thumbnail bytes"""
+
+    def __init__(self, directory=THUMBNAIL_CACHE_DIR, memory_bytes=THUMBNAIL_MEMORY_BYTES, disk_bytes=THUMBNAIL_DISK_BYTES):
+        self.memory = MemoryLRUCache(memory_bytes)
+        self.disk = DiskLRUCache(directory, disk_bytes)
+
+    @staticmethod
+    def key(printer_name, filename, modified, size):
+        """Cache key for one version of a file's thumbnail"""
+        identity = f"{printer_name}\0{filename}\0{modified}\0{size}"
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        data = self.memory.get(key)
+        if data is None:
+            data = self.disk.get(key)
+            if data is not None:
+                self.memory.put(key, data)
+        return data
+
+    def put(self, key, data):
+        self.memory.put(key, data)
+        self.disk.put(key, data)
+
+
+thumbnail_cache = ThumbnailCache()
+# (printer, filename) -> (thumbnail info, time it was looked up), for the most recent files
+_thumbnail_versions = MemoryLRUCache(THUMBNAIL_VERSION_ENTRIES, sizeof=lambda value: 1)
+
+
+def forget_thumbnail_version(printer_name, filename):
+    """Look a file's version up again on next use; called when a new job starts,
+    since the file may have been re-uploaded or re-sliced under the same name"""
+    _thumbnail_versions.pop((printer_name, filename))
+
+# Downscaled variants requested with ?w=&h=&format=, generated once per
+# (image, size, format) and kept on disk under their own budget
+THUMBNAIL_VARIANT_DIR = '/data/thumbnail_variants'
+THUMBNAIL_VARIANT_BYTES = 64 * 1024 * 1024
+THUMBNAIL_VARIANT_MAX_SIZE = 1024
+THUMBNAIL_VARIANT_QUALITY = 80
+# format parameter -> (Pillow format, mimetype)
+THUMBNAIL_VARIANT_FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+    'jpg': ('JPEG', 'image/jpeg'),
+    'png': ('PNG', 'image/png')
+}
+# JPEG has no alpha channel; transparent slicer renders are flattened onto the dashboard's dark surface
+THUMBNAIL_JPEG_BACKGROUND = (15, 23, 42)
+
+thumbnail_variants = DiskLRUCache(THUMBNAIL_VARIANT_DIR, THUMBNAIL_VARIANT_BYTES)
+
+
+def parse_variant_spec(args):
+    """(width, height, format) requested via ?w=&h=&format=, or None for the original image.
+
+    Either dimension may be omitted; both are capped at
+    THUMBNAIL_VARIANT_MAX_SIZE. The format defaults to WebP.
+    Raises ValueError for malformed parameters.
+    """
+    width, height, fmt = args.get('w'), args.get('h'), args.get('format')
+    if not (width or height or fmt):
+        return None
+    try:
+        width = int(width) if width else None
+        height = int(height) if height else None
+    except ValueError:
+        raise ValueError('w and h must be integers')
+    if (width is not None and width < 1) or (height is not None and height < 1):
+        raise ValueError('w and h must be positive')
+    fmt = (fmt or 'webp').lower()
+    if fmt not in THUMBNAIL_VARIANT_FORMATS:
+        raise ValueError(f"Unsupported format '{fmt}', use webp or jpeg")
+    width = min(width or THUMBNAIL_VARIANT_MAX_SIZE, THUMBNAIL_VARIANT_MAX_SIZE)
+    height = min(height or THUMBNAIL_VARIANT_MAX_SIZE, THUMBNAIL_VARIANT_MAX_SIZE)
+    return width, height, 'jpeg' if fmt == 'jpg' else fmt
+
+
+def _render_variant(key, data, width, height, fmt):
+    """Downscale an image to fit width x height, re-encode it and store it in the variant cache"""
+    from PIL import Image
+
+    pil_format, _ = THUMBNAIL_VARIANT_FORMATS[fmt]
+    image = Image.open(io.BytesIO(data))
+    image.thumbnail((width, height), Image.LANCZOS)  # keeps aspect ratio, never upscales
+    if pil_format == 'JPEG':
+        image = image.convert('RGBA')
+        flattened = Image.new('RGB', image.size, THUMBNAIL_JPEG_BACKGROUND)
+        flattened.paste(image, mask=image.getchannel('A'))
+        image = flattened
+    elif image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+    output = io.BytesIO()
+    image.save(output, pil_format, quality=THUMBNAIL_VARIANT_QUALITY, optimize=True)
+    variant = output.getvalue()
+    thumbnail_variants.put(key, variant)
+    return variant
+
+
+def thumbnail_variant(data, mimetype, spec):
+    """Return (bytes, mimetype) of the requested variant of an image.
+
+    Variants are keyed by the source image's content hash, so a changed
+    file never serves an old variant. Without Pillow, without a spec, or if
+    the image cannot be decoded (QOI, say), the original is returned.
+    """
+    if spec is None or not PIL_AVAILABLE:
+        return data, mimetype
+    width, height, fmt = spec
+    identity = f"{hashlib.sha1(data).hexdigest()}\0{width}x{height}\0{fmt}"
+    key = hashlib.sha1(identity.encode('utf-8')).hexdigest()
+    variant = thumbnail_variants.get(key)
+    if variant is None:
+        try:
+            # Cards rendering together ask for the same variant at once; encode it once
+            variant = upstream_flights.do(('variant', key), _render_variant, key, data, width, height, fmt)
+        except Exception as e:
+            logger.debug(f"Could not render {width}x{height} {fmt} thumbnail variant: {e}")
+            return data, mimetype
+    return variant, THUMBNAIL_VARIANT_FORMATS[fmt][1]
+
+
+def get_cached_thumbnail(printer_name, printer, filename):
+    """Thumbnail bytes for a printer's file, served from cache whenever possible.
+
+    The file version (modified time and size) is remembered for
+    THUMBNAIL_VERSION_TTL seconds, so repeat requests make no upstream
+    calls at all; after that one metadata lookup revalidates it and the
+    image is only downloaded again if the file changed.
+
+    Returns (thumbnail bytes or None, (error message, status code) or None).
+    """
+    known = _thumbnail_versions.get((printer_name, filename))
+    info = None
+    if known and time.time() - known[1] < THUMBNAIL_VERSION_TTL:
+        info = known[0]
+    else:
+        info = printer.get_thumbnail_info(filename)
+        if info is None:
+            return None, ('Could not get file metadata', 404)
+        _thumbnail_versions.put((printer_name, filename), (info, time.time()))
+    if not info:
+        return None, ('No thumbnails available', 404)
+
+    key = ThumbnailCache.key(printer_name, filename, info.get('modified'), info.get('size'))
+    data = thumbnail_cache.get(key)
+    if data is None:
+        data = printer.download_thumbnail(info)
+        if data:
+            thumbnail_cache.put(key, data)
+    return data, None
+
+
+def _thumbnail_modified(printer_name, filename):
+    """Modification time of a printer file whose thumbnail was looked up, if known"""
+    known = _thumbnail_versions.get((printer_name, filename))
+    return known[0].get('modified') if known and known[0] else None
+
+
+def _fetch_job_thumbnail(printer, filename):
+    """Get the thumbnail for `filename` from a printer, through the thumbnail cache.
+
+    Returns (thumbnail bytes or None, (error message, status code) or None).
+    """
     try:
-        resp = requests.get(remote_url, headers=headers or {}, timeout=timeout, stream=True)
-        resp.raise_for_status()
-        content_type = resp.headers.get('Content-Type', 'image/png')
-        data = resp.content
-        return data, content_type
+        return get_cached_thumbnail(printer.name, printer, filename)
     except Exception as e:
-        logger.error(f"Failed to proxy thumbnail from {remote_url}: {e}")
+        logger.error(f"Thumbnail retrieval failed for {printer.name}: {e}")
         return None, None
 
 
@@ -2500,8 +5044,8 @@ def get_thumbnail(printer_name):
             
         printer = printer_manager.printers[printer_name]
         
-        # Get current status to find filename
-        status = printer.get_status()
+        # The current job comes from the published snapshot; no upstream status query
+        status = printer_manager.get_snapshot().printers.get(printer_name)
         if not status or not status.get('online', False):
             return jsonify({'error': 'Printer offline'}), 503
         
@@ -2509,74 +5053,13 @@ def get_thumbnail(printer_name):
         if not filename:
             return jsonify({'error': 'No active print job'}), 404
         
-        # Try to get thumbnail using enhanced WebSocket API if available
-        thumbnail_data = None
-        if hasattr(printer, 'get_thumbnail'):
-            try:
-                thumbnail_data = printer.get_thumbnail(filename)
-            except Exception as e:
-                logger.error(f"Enhanced thumbnail retrieval failed for {printer_name}: {e}")
-        
-        # Fallback to original thumbnail retrieval method for Klipper
-        if not thumbnail_data and printer.printer_type == 'klipper':
-            try:
-                # Get file metadata first
-                metadata_response = printer._make_request(f'server/files/metadata?filename={filename}')
-                if not metadata_response or 'result' not in metadata_response:
-                    return jsonify({'error': 'Could not get file metadata'}), 404
-                    
-                metadata = metadata_response['result']
-                thumbnails = metadata.get('thumbnails', [])
-                
-                if not thumbnails:
-                    return jsonify({'error': 'No thumbnails available'}), 404
-                
-                # Get the largest thumbnail
-                largest_thumb = max(thumbnails, key=lambda t: t.get('width', 0) * t.get('height', 0))
-                thumb_path = largest_thumb.get('relative_path')
-                
-                if not thumb_path:
-                    return jsonify({'error': 'No valid thumbnail path'}), 404
-                
-                # Download thumbnail
-                thumb_url = f"{printer.url.rstrip('/')}/server/files/gcodes/{thumb_path}"
-                response = requests.get(thumb_url, timeout=10)
-                
-                if response.status_code == 200:
-                    thumbnail_data = response.content
-                
-            except Exception as e:
-                logger.error(f"Fallback thumbnail retrieval failed for {printer_name}: {e}")
-        
-        # Handle OctoPrint thumbnails
-        elif not thumbnail_data and printer.printer_type == 'octoprint':
-            try:
-                # OctoPrint file metadata contains a direct thumbnail URL
-                import urllib.parse
-                meta_endpoint = f"api/files/local/{urllib.parse.quote(filename, safe='')}"
-                meta = printer._make_request(meta_endpoint)
-                
-                if meta:
-                    thumb_path = meta.get('thumbnail')
-                    if thumb_path:
-                        # Construct thumbnail URL
-                        if thumb_path.startswith('/'):
-                            thumb_url = f"{printer.url}{thumb_path}"
-                        else:
-                            thumb_url = f"{printer.url}/{thumb_path}"
-                        
-                        # Set up headers for OctoPrint
-                        headers = {}
-                        if printer.api_key:
-                            headers['X-Api-Key'] = printer.api_key
-                        
-                        # Download thumbnail
-                        response = requests.get(thumb_url, headers=headers, timeout=10)
-                        if response.status_code == 200:
-                            thumbnail_data = response.content
-                            
-            except Exception as e:
-                logger.error(f"OctoPrint thumbnail retrieval failed for {printer_name}: {e}")
+        # Viewers asking for the same thumbnail at once share one download
+        thumbnail_data, error = upstream_flights.do(
+            (printer_name, 'thumbnail', filename), _fetch_job_thumbnail, printer, filename
+        )
+        if error:
+            message, status_code = error
+            return jsonify({'error': message}), status_code
         
         # Return thumbnail or placeholder
         if thumbnail_data:
@@ -2587,13 +5070,15 @@ def get_thumbnail(printer_name):
             elif thumbnail_data.startswith(b'GIF'):
                 content_type = 'image/gif'
             
-            return Response(thumbnail_data, mimetype=content_type)
+            # The URL names the printer, not the file, so browsers must revalidate
+            return thumbnail_response(thumbnail_data, content_type,
+                                      _thumbnail_modified(printer_name, filename), max_age=None)
         else:
             # Return placeholder transparent PNG (1×1)
             placeholder_png = base64.b64decode(
                 'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGMAAQAABQABDQottAAAAABJRU5ErkJggg=='
             )
-            return Response(placeholder_png, mimetype='image/png')
+            return thumbnail_response(placeholder_png, 'image/png', max_age=None)
             
     except Exception as e:
         logger.error(f"Error getting thumbnail for {printer_name}: {e}")
@@ -2609,21 +5094,23 @@ def get_thumbnail_enhanced(printer_name, filename):
             
         printer = printer_manager.printers[printer_name]
         
-        # Check if printer supports enhanced thumbnail retrieval
-        if hasattr(printer, 'get_thumbnail'):
-            try:
-                thumbnail_data = printer.get_thumbnail(filename)
-                if thumbnail_data:
-                    # Determine content type
-                    content_type = 'image/jpeg'  # Default
-                    if thumbnail_data.startswith(b'\x89PNG'):
-                        content_type = 'image/png'
-                    elif thumbnail_data.startswith(b'GIF'):
-                        content_type = 'image/gif'
-                    
-                    return Response(thumbnail_data, mimetype=content_type)
-            except Exception as e:
-                logger.error(f"Enhanced thumbnail retrieval failed: {e}")
+        # Every printer type describes its thumbnails via get_thumbnail_info
+        try:
+            thumbnail_data, _ = upstream_flights.do(
+                (printer_name, 'thumbnail', filename), _fetch_job_thumbnail, printer, filename
+            )
+            if thumbnail_data:
+                # Determine content type
+                content_type = 'image/jpeg'  # Default
+                if thumbnail_data.startswith(b'\x89PNG'):
+                    content_type = 'image/png'
+                elif thumbnail_data.startswith(b'GIF'):
+                    content_type = 'image/gif'
+                
+                return thumbnail_response(thumbnail_data, content_type,
+                                          _thumbnail_modified(printer_name, filename))
+        except Exception as e:
+            logger.error(f"Enhanced thumbnail retrieval failed: {e}")
         
         return jsonify({'error': 'Thumbnail not available or unsupported'}), 404
         
@@ -2649,7 +5136,7 @@ def list_gcode_files():
         for fname in os.listdir(GCODE_STORAGE_DIR):
             if _is_allowed_gcode(fname):
                 size = os.path.getsize(os.path.join(GCODE_STORAGE_DIR, fname))
-                files.append({'name': fname, 'size': size})
+                files.append({'name': fname, 'size': size, 'metadata': gcode_thumbnails.metadata(fname)})
         return jsonify(sorted(files, key=lambda f: f['name'].lower()))
     except Exception as e:
         logger.error(f"Error listing gcode files: {e}")
@@ -2672,6 +5159,11 @@ def upload_gcode():
         save_path = os.path.join(GCODE_STORAGE_DIR, filename)
         file.save(save_path)
         logger.info(f"Saved uploaded gcode to {save_path}")
+        try:
+            # Index the thumbnail now so the library never has to scan the file again
+            gcode_thumbnails.build(filename)
+        except Exception as e:
+            logger.error(f"Error extracting thumbnail from {filename}: {e}")
         return jsonify({'success': True, 'file': filename})
     except Exception as e:
         logger.error(f"Error uploading gcode: {e}")
@@ -2706,23 +5198,18 @@ def send_gcode_to_printer():
 
         with open(local_path, 'rb') as f:
             files = {'file': (file_name, f, 'application/octet-stream')}
+            # The printer's pooled session already carries its auth headers
             if printer.printer_type == 'klipper':
-                headers = {}
-                if printer.api_key:
-                    headers['Authorization'] = f'Bearer {printer.api_key}'
                 upload_url = f"{printer.url}/server/files/upload"
                 logger.info(f"Uploading {file_name} to {printer_name} at {upload_url}")
-                resp = requests.post(upload_url, headers=headers, files=files, timeout=120)
+                resp = printer.session.post(upload_url, files=files, timeout=120)
                 resp.raise_for_status()
                 if start_print:
                     # start the print
                     start_url = f"{printer.url}/printer/print/start"
                     data_json = {'filename': file_name}
-                    req_headers = headers.copy()
-                    req_headers['Content-Type'] = 'application/json'
-                    requests.post(start_url, headers=req_headers, json=data_json, timeout=10)
+                    printer.session.post(start_url, json=data_json, timeout=10)
             elif printer.printer_type == 'octoprint':
-                headers = {'X-Api-Key': printer.api_key} if printer.api_key else {}
                 upload_url = f"{printer.url}/api/files/local"
                 logger.info(f"Uploading {file_name} to OctoPrint {printer_name}")
                 
@@ -2731,7 +5218,7 @@ def send_gcode_to_printer():
                 if start_print:
                     form_data['print'] = 'true'  # Tell OctoPrint to start printing immediately
                 
-                resp = requests.post(upload_url, headers=headers, files=files, data=form_data, timeout=120)
+                resp = printer.session.post(upload_url, files=files, data=form_data, timeout=120)
                 logger.info(f"OctoPrint upload response: {resp.status_code}")
                 if resp.text:
                     logger.info(f"OctoPrint upload response body: {resp.text}")
@@ -2744,6 +5231,8 @@ def send_gcode_to_printer():
             else:
                 return jsonify({'success': False, 'error': 'Unsupported printer type'}), 400
 
+        # Show the new file (and the started print) without waiting for the idle interval
+        printer_manager.request_refresh(printer_name)
         return jsonify({'success': True})
 
     except requests.exceptions.RequestException as e:
@@ -2762,14 +5251,47 @@ def delete_gcode_file(filename):
         return jsonify({'success': False, 'error': 'File not found'}), 404
     try:
         os.remove(path)
+        gcode_thumbnails.remove(safe_name)
         logger.info(f"Deleted G-code file {path}")
         return jsonify({'success': True})
     except Exception as e:
         logger.error(f"Delete failed for {path}: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def start_dashboard():
+    """Load the configured printers and start polling, in the background.
+
+    Importing this module only defines the Flask app: no printers are
+    loaded and nothing is polled until this is called. The __main__ block
+    below calls it once the port is bound; any other server importing
+    `app` must call it too.
+    """
+    if printer_manager.running or printer_manager.bootstrapping:
+        return
+    printer_manager.bootstrap(storage.get_printers)
+
+def _handle_shutdown(signum, frame):
+    """Stop polling and save the status snapshot and telemetry before exiting.
+
+    run.sh stops the add-on with SIGTERM, which skips atexit handlers.
+    """
+    logger.info(f"Received signal {signum}, shutting down")
+    try:
+        printer_manager.stop()
+    finally:
+        os._exit(0)
+
 if __name__ == '__main__':
     logger.info("Starting Print Farm Dashboard Flask app...")
-    from waitress import serve
+    mark_startup('module_loaded')
+    from waitress import create_server
     logger.info("Using Waitress production WSGI server")
-    serve(app, host='127.0.0.1', port=5001, threads=6) 
\ No newline at end of file
+    # Six threads for regular requests plus one per possible /api/events stream.
+    # The port is bound before any printer client is built, so the dashboard
+    # answers right away however large the farm is.
+    server = create_server(app, host='127.0.0.1', port=5001, threads=6 + SSE_MAX_CLIENTS)
+    mark_startup('server_bound')
+    signal.signal(signal.SIGTERM, _handle_shutdown)
+    signal.signal(signal.SIGINT, _handle_shutdown)
+    start_dashboard()
+    server.run() 
\ No newline at end of file
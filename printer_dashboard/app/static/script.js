@@ -12,6 +12,10 @@ class PrintFarmDashboard {
         this.printers = new Map();
         this.updateInterval = 5000; // 5 seconds
         this.updateTimer = null;
+        this.eventSource = null;
+        this.liveUpdatesActive = false; // True while the /api/events stream is connected
+        this.statusVersion = null; // Last status version seen, for ?since= delta polling
+        this.requestedPrinters = new Set(); // Unknown printers a config reload was already asked for
         this.isUpdating = false;
         this.filters = {
             status: 'all',
@@ -55,15 +59,18 @@ class PrintFarmDashboard {
         this.loadPrinters();
         this.loadRoomLightStatus();
         this.startAutoUpdate();
+        this.startLiveUpdates();
 
         // Refresh immediately when the page becomes visible/focused
         document.addEventListener('visibilitychange', () => {
-            if (!document.hidden) {
+            if (!document.hidden && !this.liveUpdatesActive) {
                 this.updateAllStatus();
             }
         });
         window.addEventListener('focus', () => {
-            this.updateAllStatus();
+            if (!this.liveUpdatesActive) {
+                this.updateAllStatus();
+            }
         });
     }
     
@@ -378,6 +385,7 @@ class PrintFarmDashboard {
             }
             
             // Initialize printer objects
+            this.printers.clear();
             printerConfigs.forEach(config => {
                 this.printers.set(config.name, {
                     config: config,
@@ -397,6 +405,8 @@ class PrintFarmDashboard {
             
             this.hideLoading();
             this.createPrinterCards();
+            // New cards need every printer's status, not just recent changes
+            this.statusVersion = null;
             this.updateAllStatus();
             
         } catch (error) {
@@ -412,24 +422,20 @@ class PrintFarmDashboard {
         this.setRefreshButtonState(true);
         
         try {
-            const response = await fetch('api/status');
+            // Ask only for printers that changed since the version we already have
+            const response = await fetch(`api/status?since=${encodeURIComponent(this.statusVersion || '')}`);
             if (!response.ok) {
                 throw new Error(`HTTP ${response.status}: ${response.statusText}`);
             }
             
             const statusData = await response.json();
-            
-            // Update each printer's status
-            for (const [printerName, printer] of this.printers.entries()) {
-                if (statusData[printerName]) {
-                    printer.status = statusData[printerName];
-                    printer.lastUpdate = new Date();
-                    this.updatePrinterCard(printerName, printer);
-                }
+            this.statusVersion = statusData.version;
+            if (statusData.full) {
+                this.removeMissingPrinters(statusData.printers);
+            } else {
+                this.removePrinters(statusData.removed || []);
             }
-            
-            this.updateSummary();
-            this.applyFilters();
+            this.applyStatusData(statusData.printers);
             
         } catch (error) {
             console.error('Error updating status:', error);
@@ -440,6 +446,88 @@ class PrintFarmDashboard {
         }
     }
     
+    applyStatusData(statusData) {
+        // A printer added since the page loaded: reload the configs to build its card
+        const unknown = Object.keys(statusData).filter(name => !this.printers.has(name) && !this.requestedPrinters.has(name));
+        if (unknown.length) {
+            unknown.forEach(name => this.requestedPrinters.add(name));
+            this.loadPrinters();
+        }
+        
+        // Update each printer present in statusData (a full snapshot or a delta)
+        for (const [printerName, printer] of this.printers.entries()) {
+            if (statusData[printerName]) {
+                printer.status = statusData[printerName];
+                printer.lastUpdate = new Date();
+                this.updatePrinterCard(printerName, printer);
+            }
+        }
+        
+        this.updateSummary();
+        this.applyFilters();
+    }
+    
+    removePrinters(names) {
+        // Drop the cards of printers the server no longer has
+        if (!names.length) return;
+        for (const printerName of names) {
+            this.printers.delete(printerName);
+            const card = document.querySelector(`[data-printer-name="${CSS.escape(printerName)}"]`);
+            if (card) card.remove();
+        }
+        this.updateSummary();
+        this.applyFilters();
+    }
+    
+    removeMissingPrinters(statusData) {
+        // A full status lists every printer; an empty one means the poller has no data yet,
+        // and one restored from before a restart may predate newly configured printers
+        const statuses = Object.values(statusData);
+        if (!statuses.length || statuses.some(status => status && (status.restored || status.stale))) return;
+        this.removePrinters([...this.printers.keys()].filter(name => !(name in statusData)));
+    }
+    
+    startLiveUpdates() {
+        // Stream status changes over Server-Sent Events; the auto-update timer
+        // polls instead whenever the stream is not connected
+        if (!window.EventSource) {
+            return;
+        }
+        
+        const source = new EventSource('api/events');
+        this.eventSource = source;
+        let opened = false;
+        
+        source.addEventListener('open', () => {
+            opened = true;
+            this.liveUpdatesActive = true;
+        });
+        source.addEventListener('snapshot', (event) => {
+            this.statusVersion = event.lastEventId || this.statusVersion;
+            const statusData = JSON.parse(event.data);
+            this.removeMissingPrinters(statusData);
+            this.applyStatusData(statusData);
+        });
+        source.addEventListener('status', (event) => {
+            this.statusVersion = event.lastEventId || this.statusVersion;
+            this.applyStatusData(JSON.parse(event.data));
+        });
+        source.addEventListener('removed', (event) => {
+            this.statusVersion = event.lastEventId || this.statusVersion;
+            this.removePrinters(JSON.parse(event.data));
+        });
+        source.addEventListener('error', () => {
+            // EventSource reconnects on its own after a dropped stream; poll meanwhile,
+            // and give up on SSE entirely if it never managed to connect
+            this.liveUpdatesActive = false;
+            if (!opened || source.readyState === EventSource.CLOSED) {
+                source.close();
+                this.eventSource = null;
+                console.warn('Live status stream unavailable, falling back to polling');
+            }
+        });
+    }
+    
     createPrinterCards() {
         const grid = document.getElementById('printers-grid');
         const template = document.getElementById('printer-card-template');
@@ -546,6 +634,12 @@ class PrintFarmDashboard {
                 statusIndicator.classList.add('online');
             }
         }
+
+        // Restored-after-restart or late data: show it, but mark it as last known
+        card.classList.toggle('stale', !!status.stale);
+        if (status.stale) {
+            statusText.textContent += ' (last known)';
+        }
         
         // Update file name and progress
         const fileName = card.querySelector('.file-name');
@@ -785,8 +879,7 @@ class PrintFarmDashboard {
 
                     const fileName = lastFile || 'last file';
                     this.showNotification(`Started reprinting ${fileName}`, 'success');
-                    // Refresh status after a short delay
-                    setTimeout(() => this.updateAllStatus(), 2000);
+                    this.refreshAfterAction();
                 } catch (error) {
                     console.error('Reprint error:', error);
                     this.showNotification(`Failed to start reprint: ${error.message}`, 'error');
@@ -982,8 +1075,7 @@ class PrintFarmDashboard {
             
             if (result.success) {
                 this.showNotification(`${action} command sent to ${printerName}`, 'success');
-                // Refresh status after a short delay
-                setTimeout(() => this.updateAllStatus(), 2000);
+                this.refreshAfterAction();
             } else {
                 this.showNotification(`Failed to ${action} ${printerName}: ${result.error}`, 'error');
             }
@@ -1071,9 +1163,19 @@ class PrintFarmDashboard {
         }, 5000);
     }
     
+    refreshAfterAction() {
+        // The server re-polls the printer as soon as a command is sent; with the
+        // live stream connected the change arrives by itself, otherwise fetch it
+        if (!this.liveUpdatesActive) {
+            setTimeout(() => this.updateAllStatus(), 1000);
+        }
+    }
+
     startAutoUpdate() {
         this.updateTimer = setInterval(() => {
-            this.updateAllStatus();
+            if (!this.liveUpdatesActive) {
+                this.updateAllStatus();
+            }
             
             // Also check light status periodically, especially in ingress mode
             const lightBtn = document.getElementById('room-light-btn');
@@ -1897,9 +1999,15 @@ class PrintFarmDashboard {
         });
     }
 
+    // Ask the server for a downscaled thumbnail fitting width x height CSS pixels
+    thumbnailSize(width, height) {
+        const scale = window.devicePixelRatio || 1;
+        return `w=${Math.round(width * scale)}&h=${Math.round(height * scale)}`;
+    }
+
     async loadThumbnail(printerName, file, card) {
         try {
-            const response = await fetch(`api/thumbnail/${encodeURIComponent(printerName)}?file=${encodeURIComponent(file)}`);
+            const response = await fetch(`api/thumbnail/${encodeURIComponent(printerName)}?file=${encodeURIComponent(file)}&${this.thumbnailSize(360, 180)}`);
             if (response.ok) {
                 const blob = await response.blob();
                 const objectURL = URL.createObjectURL(blob);
@@ -2008,7 +2116,7 @@ class PrintFarmDashboard {
 
                 const thumb = document.createElement('img');
                 thumb.className = 'file-thumb';
-                thumb.src = `files/thumbnail?filename=${encodeURIComponent(f.name)}`;
+                thumb.src = `files/thumbnail?filename=${encodeURIComponent(f.name)}&${this.thumbnailSize(40, 40)}`;
                 thumb.style.width = '40px';
                 thumb.style.height = '40px';
                 thumb.style.objectFit = 'contain';
@@ -2081,7 +2189,7 @@ class PrintFarmDashboard {
 
         // Load thumbnail
         try {
-            const response = await fetch(`files/thumbnail?filename=${encodeURIComponent(fileName)}`);
+            const response = await fetch(`files/thumbnail?filename=${encodeURIComponent(fileName)}&${this.thumbnailSize(360, 260)}`);
             if (response.ok) {
                 const blob = await response.blob();
                 this.printThumbnail.src = URL.createObjectURL(blob);
@@ -2475,8 +2583,7 @@ class PrintFarmDashboard {
             this.showNotification(`${heaterName} temperature set to ${temperature}°C`, 'success');
             this.hideTemperatureModal();
             
-            // Refresh status after a short delay
-            setTimeout(() => this.updateAllStatus(), 2000);
+            this.refreshAfterAction();
             
         } catch (error) {
             console.error('Temperature control error:', error);